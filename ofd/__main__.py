@@ -66,7 +66,7 @@ def create_parser() -> argparse.ArgumentParser:
         epilog="""
 Command Details:
   validate   [--json-files] [--logos] [--folder-names] [--store-ids] [--gtin]
-  build      [-o DIR] [--skip-json] [--skip-sqlite] [--skip-csv] [--skip-api]
+  build      [-o DIR] [--skip-json] [--skip-sqlite] [--skip-csv] [--skip-api] [--bundle]
   serve      [-d DIR] [-p PORT] [--host HOST]
   script     [--list] <script_name> [script_args...]
   webui      [-p PORT] [--host HOST] [--open] [--install]
@@ -9,6 +9,7 @@ import argparse
 import json
 import sys
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -142,6 +143,18 @@ class BaseScript(ABC):
         if not self.json_mode:
             print(message)
 
+    def log_lines(self, lines: Iterable[str]) -> None:
+        """
+        Log several lines with a single write (respects json_mode).
+
+        Args:
+            lines: Lines to log, without trailing newlines
+        """
+        if not self.json_mode:
+            lines = list(lines)
+            if lines:
+                print("\n".join(lines))
+
     def main(self, argv: list[str] | None = None) -> int:
         """
         Main entry point for the script.
@@ -6,6 +6,7 @@ computed fields (UUIDs, slugs, foreign keys) overlaid on top.
 """
 
 import json
+import os
 from pathlib import Path
 
 from .errors import BuildResult
@@ -19,11 +20,19 @@ from .utils import (
     generate_size_id,
     generate_store_id,
     generate_variant_id,
+    load_json_bytes,
     normalize_color_hex,
     slugify,
+    subdirs,
 )
 
 
+def _load_json(path: str | Path):
+    """Parse a JSON file (see load_json_bytes)."""
+    with open(path, "rb") as f:
+        return load_json_bytes(f.read())
+
+
 class DataCrawler:
     """Crawls the data directory structure and builds normalized database."""
 
@@ -68,12 +77,7 @@ class DataCrawler:
             )
             return
 
-        for store_dir in sorted(self.stores_dir.iterdir()):
-            if not store_dir.is_dir():
-                continue
-            if store_dir.name.startswith("."):
-                continue
-
+        for store_dir in subdirs(self.stores_dir, skip_hidden=True):
             self._process_store_directory(store_dir)
 
     def _process_store_directory(self, store_dir: Path):
@@ -83,8 +87,7 @@ class DataCrawler:
             return
 
         try:
-            with open(store_json, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json(store_json)
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", store_json)
             return
@@ -120,12 +123,7 @@ class DataCrawler:
             return
 
         # Each subdirectory of data/ is a brand
-        for brand_dir in sorted(self.data_dir.iterdir()):
-            if not brand_dir.is_dir():
-                continue
-            if brand_dir.name.startswith("."):
-                continue
-
+        for brand_dir in subdirs(self.data_dir, skip_hidden=True):
             self._process_brand_directory(brand_dir)
 
     def _process_brand_directory(self, brand_dir: Path):
@@ -139,8 +137,7 @@ class DataCrawler:
             return
 
         try:
-            with open(brand_json, encoding="utf-8") as f:
-                brand_data = json.load(f)
+            brand_data = _load_json(brand_json)
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", brand_json)
             return
@@ -167,12 +164,7 @@ class DataCrawler:
         self._brand_cache[brand_name] = brand_id
 
         # Each subdirectory is a material type
-        for material_dir in sorted(brand_dir.iterdir()):
-            if not material_dir.is_dir():
-                continue
-            if material_dir.name.startswith("."):
-                continue
-
+        for material_dir in subdirs(brand_dir, skip_hidden=True):
             self._process_material_directory(material_dir, brand_id)
 
     def _process_material_directory(self, material_dir: Path, brand_id: str):
@@ -184,8 +176,7 @@ class DataCrawler:
         material_data = {}
         if material_json.exists():
             try:
-                with open(material_json, encoding="utf-8") as f:
-                    material_data = json.load(f)
+                material_data = _load_json(material_json)
             except (OSError, json.JSONDecodeError) as e:
                 self._result.add_warning("JSON Parse", f"Failed to parse: {e}", material_json)
 
@@ -208,12 +199,7 @@ class DataCrawler:
             self._material_cache[cache_key] = material_id
 
         # Each subdirectory is a filament line
-        for filament_dir in sorted(material_dir.iterdir()):
-            if not filament_dir.is_dir():
-                continue
-            if filament_dir.name.startswith("."):
-                continue
-
+        for filament_dir in subdirs(material_dir, skip_hidden=True):
             self._process_filament_directory(filament_dir, brand_id, material_id, material_name)
 
     def _process_filament_directory(
@@ -227,8 +213,7 @@ class DataCrawler:
             return
 
         try:
-            with open(filament_json, encoding="utf-8") as f:
-                filament_data = json.load(f)
+            filament_data = _load_json(filament_json)
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", filament_json)
             return
@@ -257,27 +242,25 @@ class DataCrawler:
         self.db.filaments.append(filament)
 
         # Each subdirectory is a color variant
-        for variant_dir in sorted(filament_dir.iterdir()):
-            if not variant_dir.is_dir():
-                continue
-            if variant_dir.name.startswith("."):
-                continue
-
+        for variant_dir in subdirs(filament_dir, skip_hidden=True):
             self._process_variant_directory(variant_dir, filament_id)
 
     def _process_variant_directory(self, variant_dir: Path, filament_id: str):
         """Process a variant (color) directory."""
+        # This runs once per colour, so file paths are joined as plain strings
+        # and only wrapped in Path when a warning needs one.
+        base = os.fspath(variant_dir)
+
         # Load variant.json
-        variant_json = variant_dir / "variant.json"
-        if not variant_json.exists():
+        variant_json = os.path.join(base, "variant.json")
+        if not os.path.exists(variant_json):
             self._result.add_warning("Missing File", "Missing variant.json", variant_dir)
             return
 
         try:
-            with open(variant_json, encoding="utf-8") as f:
-                variant_data = json.load(f)
+            variant_data = _load_json(variant_json)
         except (OSError, json.JSONDecodeError) as e:
-            self._result.add_warning("JSON Parse", f"Failed to parse: {e}", variant_json)
+            self._result.add_warning("JSON Parse", f"Failed to parse: {e}", Path(variant_json))
             return
 
         # Use source "id" for UUID generation (matches directory name, preserves UUIDs)
@@ -315,17 +298,16 @@ class DataCrawler:
         self.db.variants.append(variant)
 
         # Load sizes.json
-        sizes_json = variant_dir / "sizes.json"
-        if sizes_json.exists():
+        sizes_json = os.path.join(base, "sizes.json")
+        if os.path.exists(sizes_json):
             self._process_sizes_file(sizes_json, variant_id)
 
-    def _process_sizes_file(self, sizes_json: Path, variant_id: str):
+    def _process_sizes_file(self, sizes_json: str, variant_id: str):
         """Process sizes.json file to create sizes and purchase links."""
         try:
-            with open(sizes_json, encoding="utf-8") as f:
-                sizes_data = json.load(f)
+            sizes_data = _load_json(sizes_json)
         except (OSError, json.JSONDecodeError) as e:
-            self._result.add_warning("JSON Parse", f"Failed to parse: {e}", sizes_json)
+            self._result.add_warning("JSON Parse", f"Failed to parse: {e}", Path(sizes_json))
             return
 
         if not isinstance(sizes_data, list):
@@ -334,7 +316,7 @@ class DataCrawler:
         for idx, size_entry in enumerate(sizes_data):
             self._create_size(size_entry, variant_id, idx, sizes_json)
 
-    def _create_size(self, size_entry: dict, variant_id: str, index: int, sizes_json: Path):
+    def _create_size(self, size_entry: dict, variant_id: str, index: int, sizes_json: str):
         """Create a size entity from a sizes.json entry."""
         weight = size_entry.get("filament_weight")
         diameter = size_entry.get("diameter", 1.75)
@@ -344,7 +326,7 @@ class DataCrawler:
 
         if weight is None:
             self._result.add_warning(
-                "Missing Field", f"Size entry [{index}] missing filament_weight", sizes_json
+                "Missing Field", f"Size entry [{index}] missing filament_weight", Path(sizes_json)
             )
             return
 
@@ -379,7 +361,7 @@ class DataCrawler:
             self._create_purchase_link(pl_entry, size_id, index, pl_idx, sizes_json)
 
     def _create_purchase_link(
-        self, pl_entry: dict, size_id: str, size_index: int, link_index: int, sizes_json: Path
+        self, pl_entry: dict, size_id: str, size_index: int, link_index: int, sizes_json: str
     ):
         """Create a purchase link entity."""
         original_store_id = pl_entry.get("store_id")
@@ -389,7 +371,7 @@ class DataCrawler:
             self._result.add_warning(
                 "Missing Field",
                 f"Purchase link [{size_index}].purchase_links[{link_index}] missing store_id or url",
-                sizes_json,
+                Path(sizes_json),
             )
             return
 
@@ -399,7 +381,7 @@ class DataCrawler:
             self._result.add_warning(
                 "Invalid Reference",
                 f"Unknown store_id '{original_store_id}' at [{size_index}].purchase_links[{link_index}]",
-                sizes_json,
+                Path(sizes_json),
             )
             return
 
@@ -77,9 +77,8 @@ class BuildResult:
                 errors_by_category[error.category] = []
             errors_by_category[error.category].append(error)
 
-        # Print errors grouped by category
+        # Print errors grouped by category, one write per category
         for category, errors in sorted(errors_by_category.items()):
-            print(f"\n{category} ({len(errors)}):")
-            print("-" * 80)
-            for error in errors:
-                print(f"  {error}")
+            lines = [f"\n{category} ({len(errors)}):", "-" * 80]
+            lines.extend(f"  {error}" for error in errors)
+            print("\n".join(lines))
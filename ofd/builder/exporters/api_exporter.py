@@ -5,13 +5,18 @@ Follows the native data directory hierarchy:
   /brands/{brand}/materials/{material}/filaments/{filament}/variants/{variant}
 """
 
+import gzip
 import json
+import os
 import shutil
+import tarfile
 import uuid
+from collections import defaultdict
 from pathlib import Path
 
 from ..models import Database
 from ..serialization import entity_to_dict
+from ..utils import write_json, write_json_nomkdir
 
 
 def merge_schemas(base_schema: dict, logo_schema: dict) -> dict:
@@ -78,9 +83,7 @@ def export_schemas(
                 merged_schema = merge_schemas(base_schema, logo_schemas[logo_schema_name])
 
                 # Write merged schema
-                dest = schemas_path / logo_schema_name
-                with open(dest, "w", encoding="utf-8") as f:
-                    json.dump(merged_schema, f, indent=2, ensure_ascii=False)
+                write_json(schemas_path / logo_schema_name, merged_schema)
 
                 # Extract schema name (e.g., "brand_logo_schema.json" -> "brand_logo")
                 name = schema_file.stem.replace("_schema", "") + "_logo"
@@ -94,7 +97,7 @@ def export_schemas(
             else:
                 # Copy base schema as-is
                 dest = schemas_path / schema_file.name
-                shutil.copy2(schema_file, dest)
+                shutil.copyfile(schema_file, dest)
 
                 # Extract schema name from filename (e.g., "brand_schema.json" -> "brand")
                 name = schema_file.stem.replace("_schema", "").replace("-schema", "")
@@ -112,7 +115,7 @@ def export_schemas(
 
             # Copy standalone schema from builder/schemas
             dest = schemas_path / schema_file.name
-            shutil.copy2(schema_file, dest)
+            shutil.copyfile(schema_file, dest)
 
             # Extract schema name from filename
             name = schema_file.stem.replace("_schema", "").replace("-schema", "")
@@ -129,18 +132,42 @@ def export_schemas(
         "schemas": schema_files,
     }
 
-    index_path = schemas_path / "index.json"
-    with open(index_path, "w", encoding="utf-8") as f:
-        json.dump(schemas_index, f, indent=2, ensure_ascii=False)
+    write_json(schemas_path / "index.json", schemas_index)
 
     return len(schema_files)
 
 
-def write_json(path: Path, data: dict):
-    """Write JSON file with consistent formatting."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+def _normalize_tarinfo(info: tarfile.TarInfo) -> tarfile.TarInfo:
+    """Drop build-machine details so identical trees give identical bundles."""
+    info.mtime = 0
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    return info
+
+
+def export_api_bundle(api_path: Path) -> Path:
+    """
+    Pack the whole API tree into a single gzip-compressed tarball next to it.
+
+    Clients that want everything can fetch one file instead of thousands of small
+    JSON files. Entries are stored in sorted order with normalized metadata.
+    Only files already under ``api_path`` are packed, so badges (written by a later
+    build step) are not included.
+    """
+    bundle_path = api_path.parent / f"{api_path.name}.tar.gz"
+    with open(bundle_path, "wb") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0) as gz:
+            with tarfile.open(fileobj=gz, mode="w", format=tarfile.PAX_FORMAT) as tar:
+                for dirpath, dirnames, filenames in os.walk(api_path):
+                    dirnames.sort()
+                    rel_dir = os.path.relpath(dirpath, api_path.parent)
+                    for filename in sorted(filenames):
+                        tar.add(
+                            os.path.join(dirpath, filename),
+                            arcname=f"{rel_dir}/{filename}",
+                            filter=_normalize_tarinfo,
+                        )
+    return bundle_path
 
 
 def generate_logo_id(name: str, logo_filename: str) -> tuple[str, str]:
@@ -150,81 +177,97 @@ def generate_logo_id(name: str, logo_filename: str) -> tuple[str, str]:
     unique_string = f"{name}:{logo_filename}"
     deterministic_uuid = uuid.uuid5(namespace, unique_string)
 
-    # Get file extension
-    ext = Path(logo_filename).suffix[1:]
+    # Get file extension (same result as Path.suffix for bare filenames, incl. ".png")
+    stem, _, ext = logo_filename.rpartition(".")
+    if not stem:
+        ext = ""
 
     # Create logo ID: name_logofilename_uuid
     logo_id = f"{name}_{logo_filename.replace('.', '_')}_{deterministic_uuid.hex[:8]}"
     return logo_id, ext
 
 
-def export_brand_logos(db: Database, api_path: Path, data_dir: Path) -> tuple[int, dict[str, str]]:
+def _copy_logo(source: Path, dest: Path, entity_type: str, entity: dict) -> None:
+    """Copy one logo; opening the source doubles as the existence check."""
+    try:
+        shutil.copyfile(source, dest)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Logo file not found for {entity_type} '{entity['name']}': {source}\n"
+            f"Expected logo '{entity['logo']}' in directory '{entity['directory_name']}'"
+        ) from None
+
+
+def _export_logos(
+    entities: list[dict], entity_type: str, logos_path: Path, source_dir: Path
+) -> tuple[int, dict[str, str]]:
     """
-    Export brand logos to API.
+    Copy logos for brands or stores and write their metadata and index files.
 
     Returns:
-        Tuple of (copied_count, logo_id_mapping) where logo_id_mapping maps brand_id -> logo_id
+        Tuple of (copied_count, logo_id_mapping) where logo_id_mapping maps entity id -> logo_id
     """
-    logos_path = api_path / "brands" / "logo"
     logos_path.mkdir(parents=True, exist_ok=True)
 
     logo_index = []
     copied_count = 0
-    logo_id_mapping = {}  # brand_id -> logo_id
+    logo_id_mapping = {}  # entity id -> logo_id
 
-    for brand in db.brands:
-        # Skip brands with no logo field (empty string)
-        if not brand.get("logo"):
+    for entity in entities:
+        # Skip entities with no logo field (empty string)
+        if not entity.get("logo"):
             continue
 
-        logo_id, ext = generate_logo_id(brand["name"], brand["logo"])
+        logo_id, ext = generate_logo_id(entity["name"], entity["logo"])
 
         # Source logo path - use directory_name instead of slug
-        brand_dir = data_dir / brand["directory_name"]
-        logo_source = brand_dir / brand["logo"]
-
-        if not logo_source.exists():
-            raise FileNotFoundError(
-                f"Logo file not found for brand '{brand['name']}': {logo_source}\n"
-                f"Expected logo '{brand['logo']}' in directory '{brand['directory_name']}'"
-            )
+        logo_source = source_dir / entity["directory_name"] / entity["logo"]
 
-        # Copy logo file
-        logo_dest = logos_path / f"{logo_id}.{ext}"
-        shutil.copy2(logo_source, logo_dest)
+        # Copy logo file (a missing source is reported by the copy itself)
+        _copy_logo(logo_source, logos_path / f"{logo_id}.{ext}", entity_type, entity)
 
         # Create JSON metadata file
         logo_json = {
             "id": logo_id,
             "slug": logo_id,
-            "brand_id": brand["id"],
-            "brand_name": brand["name"],
-            "filename": brand["logo"],
+            f"{entity_type}_id": entity["id"],
+            f"{entity_type}_name": entity["name"],
+            "filename": entity["logo"],
             "extension": ext,
             "logo_file": f"{logo_id}.{ext}",
         }
-        write_json(logos_path / f"{logo_id}.json", logo_json)
+        write_json_nomkdir(logos_path / f"{logo_id}.json", logo_json)
 
         logo_index.append(
             {
                 "id": logo_id,
                 "slug": logo_id,
-                "brand_id": brand["id"],
-                "brand_name": brand["name"],
+                f"{entity_type}_id": entity["id"],
+                f"{entity_type}_name": entity["name"],
                 "path": f"{logo_id}.json",
             }
         )
 
         # Add to mapping (with file extension)
-        logo_id_mapping[brand["id"]] = f"{logo_id}.{ext}"
+        logo_id_mapping[entity["id"]] = f"{logo_id}.{ext}"
         copied_count += 1
 
     # Write index
-    write_json(logos_path / "index.json", {"count": len(logo_index), "logos": logo_index})
+    write_json_nomkdir(logos_path / "index.json", {"count": len(logo_index), "logos": logo_index})
 
     return copied_count, logo_id_mapping
 
 
+def export_brand_logos(db: Database, api_path: Path, data_dir: Path) -> tuple[int, dict[str, str]]:
+    """
+    Export brand logos to API.
+
+    Returns:
+        Tuple of (copied_count, logo_id_mapping) where logo_id_mapping maps brand_id -> logo_id
+    """
+    return _export_logos(db.brands, "brand", api_path / "brands" / "logo", data_dir)
+
+
 def export_store_logos(
     db: Database, api_path: Path, stores_dir: Path
 ) -> tuple[int, dict[str, str]]:
@@ -234,64 +277,7 @@ def export_store_logos(
     Returns:
         Tuple of (copied_count, logo_id_mapping) where logo_id_mapping maps store_id -> logo_id
     """
-    logos_path = api_path / "stores" / "logo"
-    logos_path.mkdir(parents=True, exist_ok=True)
-
-    logo_index = []
-    copied_count = 0
-    logo_id_mapping = {}  # store_id -> logo_id
-
-    for store in db.stores:
-        # Skip stores with no logo field (empty string)
-        if not store.get("logo"):
-            continue
-
-        logo_id, ext = generate_logo_id(store["name"], store["logo"])
-
-        # Source logo path - use directory_name instead of slug
-        store_dir = stores_dir / store["directory_name"]
-        logo_source = store_dir / store["logo"]
-
-        if not logo_source.exists():
-            raise FileNotFoundError(
-                f"Logo file not found for store '{store['name']}': {logo_source}\n"
-                f"Expected logo '{store['logo']}' in directory '{store['directory_name']}'"
-            )
-
-        # Copy logo file
-        logo_dest = logos_path / f"{logo_id}.{ext}"
-        shutil.copy2(logo_source, logo_dest)
-
-        # Create JSON metadata file
-        logo_json = {
-            "id": logo_id,
-            "slug": logo_id,
-            "store_id": store["id"],
-            "store_name": store["name"],
-            "filename": store["logo"],
-            "extension": ext,
-            "logo_file": f"{logo_id}.{ext}",
-        }
-        write_json(logos_path / f"{logo_id}.json", logo_json)
-
-        logo_index.append(
-            {
-                "id": logo_id,
-                "slug": logo_id,
-                "store_id": store["id"],
-                "store_name": store["name"],
-                "path": f"{logo_id}.json",
-            }
-        )
-
-        # Add to mapping (with file extension)
-        logo_id_mapping[store["id"]] = f"{logo_id}.{ext}"
-        copied_count += 1
-
-    # Write index
-    write_json(logos_path / "index.json", {"count": len(logo_index), "logos": logo_index})
-
-    return copied_count, logo_id_mapping
+    return _export_logos(db.stores, "store", api_path / "stores" / "logo", stores_dir)
 
 
 def export_api(
@@ -305,9 +291,18 @@ def export_api(
     data_dir: str = "data",
     stores_dir: str = "stores",
     commit: str | None = None,
+    bundle: bool = False,
+    include_logos: bool = True,
     **kwargs,
 ):
-    """Export static API structure following native directory hierarchy."""
+    """
+    Export static API structure following native directory hierarchy.
+
+    With ``bundle``, the finished tree is also packed into ``api/v1.tar.gz``
+    (see export_api_bundle; badges are not included). ``include_logos=False``
+    skips copying brand/store logos, e.g. for a Database built in memory with no
+    source directories; otherwise a missing logo file raises FileNotFoundError.
+    """
     api_path = Path(output_dir) / "api" / "v1"
     api_path.mkdir(parents=True, exist_ok=True)
 
@@ -322,32 +317,85 @@ def export_api(
         print(f"  Written: {schemas_count} schemas")
 
     # Export brand and store logos (get logo ID mappings)
-    data_path = Path(data_dir)
-    stores_path = Path(stores_dir)
-    brand_logos_count, brand_logo_id_mapping = export_brand_logos(db, api_path, data_path)
-    store_logos_count, store_logo_id_mapping = export_store_logos(db, api_path, stores_path)
-    print(f"  Written: {brand_logos_count} brand logos, {store_logos_count} store logos")
+    brand_logos_count = store_logos_count = 0
+    brand_logo_id_mapping: dict[str, str] = {}
+    store_logo_id_mapping: dict[str, str] = {}
+    if include_logos:
+        brand_logos_count, brand_logo_id_mapping = export_brand_logos(db, api_path, Path(data_dir))
+        store_logos_count, store_logo_id_mapping = export_store_logos(
+            db, api_path, Path(stores_dir)
+        )
+        print(f"  Written: {brand_logos_count} brand logos, {store_logos_count} store logos")
 
     # Build lookup maps for efficient access
-    materials_by_brand = {}
+    materials_by_brand = defaultdict(list)
     for m in db.materials:
-        materials_by_brand.setdefault(m["brand_id"], []).append(m)
+        materials_by_brand[m["brand_id"]].append(m)
 
-    filaments_by_material = {}
+    filaments_by_material = defaultdict(list)
     for f in db.filaments:
-        filaments_by_material.setdefault(f["material_id"], []).append(f)
+        filaments_by_material[f["material_id"]].append(f)
 
-    variants_by_filament = {}
+    variants_by_filament = defaultdict(list)
     for v in db.variants:
-        variants_by_filament.setdefault(v["filament_id"], []).append(v)
+        variants_by_filament[v["filament_id"]].append(v)
 
-    sizes_by_variant = {}
+    sizes_by_variant = defaultdict(list)
     for s in db.sizes:
-        sizes_by_variant.setdefault(s["variant_id"], []).append(s)
+        sizes_by_variant[s["variant_id"]].append(s)
 
-    purchase_links_by_size = {}
+    purchase_links_by_size = defaultdict(list)
     for pl in db.purchase_links:
-        purchase_links_by_size.setdefault(pl["size_id"], []).append(pl)
+        purchase_links_by_size[pl["size_id"]].append(pl)
+
+    # Export each entity once, keyed by identity (entities are unhashable dicts).
+    # Leaf files share these dicts; anything that gets extra keys is copied first.
+    exported = {
+        id(entity): entity_to_dict(entity)
+        for entities in (
+            db.brands,
+            db.materials,
+            db.filaments,
+            db.variants,
+            db.sizes,
+            db.stores,
+            db.purchase_links,
+        )
+        for entity in entities
+    }
+
+    # Listing entries for each parent index, built once per entity up front.
+    material_summaries = {
+        id(mat): {
+            "id": mat["id"],
+            "material": mat["material"],
+            "slug": mat["slug"],
+            "filament_count": len(filaments_by_material.get(mat["id"], [])),
+            "path": f"materials/{mat['slug']}/index.json",
+        }
+        for mat in db.materials
+    }
+    filament_summaries = {
+        id(fil): {
+            "id": fil["id"],
+            "name": fil["name"],
+            "slug": fil["slug"],
+            "variant_count": len(variants_by_filament.get(fil["id"], [])),
+            "path": f"filaments/{fil['slug']}/index.json",
+        }
+        for fil in db.filaments
+    }
+    variant_summaries = {
+        id(var): {
+            "id": var["id"],
+            "name": var["name"],
+            "color_hex": var["color_hex"],
+            "slug": var["slug"],
+            "size_count": len(sizes_by_variant.get(var["id"], [])),
+            "path": f"variants/{var['slug']}.json",
+        }
+        for var in db.variants
+    }
 
     # Root index
     endpoints = {
@@ -359,6 +407,8 @@ def export_api(
         "all": "../json/all.json",
         "search_index": "search-index.json",
     }
+    if bundle:
+        endpoints["bundle"] = "../v1.tar.gz"
     if schemas_count > 0:
         endpoints["schemas"] = "schemas/index.json"
 
@@ -431,95 +481,60 @@ def export_api(
     for brand in db.brands:
         brand_path = brands_path / brand["slug"]
         brand_materials = materials_by_brand.get(brand["id"], [])
+        brand_path.mkdir(parents=True, exist_ok=True)
 
-        # Brand index with materials list
-        materials_list = []
-        for mat in brand_materials:
-            mat_filaments = filaments_by_material.get(mat["id"], [])
-            materials_list.append(
-                {
-                    "id": mat["id"],
-                    "material": mat["material"],
-                    "slug": mat["slug"],
-                    "filament_count": len(mat_filaments),
-                    "path": f"materials/{mat['slug']}/index.json",
-                }
-            )
-
-        brand_data = entity_to_dict(brand)
-        brand_data["materials"] = materials_list
+        brand_data = dict(exported[id(brand)])
+        brand_data["materials"] = [material_summaries[id(mat)] for mat in brand_materials]
         # Add logo_slug if brand has a logo
         if brand["id"] in brand_logo_id_mapping:
             brand_data["logo_slug"] = brand_logo_id_mapping[brand["id"]]
-        write_json(brand_path / "index.json", brand_data)
+        write_json_nomkdir(brand_path / "index.json", brand_data)
         brand_count += 1
 
         # Per-material structure
         for mat in brand_materials:
             mat_path = brand_path / "materials" / mat["slug"]
             mat_filaments = filaments_by_material.get(mat["id"], [])
+            mat_path.mkdir(parents=True, exist_ok=True)
 
-            # Material index with filaments list
-            filaments_list = []
-            for fil in mat_filaments:
-                fil_variants = variants_by_filament.get(fil["id"], [])
-                filaments_list.append(
-                    {
-                        "id": fil["id"],
-                        "name": fil["name"],
-                        "slug": fil["slug"],
-                        "variant_count": len(fil_variants),
-                        "path": f"filaments/{fil['slug']}/index.json",
-                    }
-                )
-
-            mat_data = entity_to_dict(mat)
-            mat_data["filaments"] = filaments_list
-            write_json(mat_path / "index.json", mat_data)
+            mat_data = dict(exported[id(mat)])
+            mat_data["filaments"] = [filament_summaries[id(fil)] for fil in mat_filaments]
+            write_json_nomkdir(mat_path / "index.json", mat_data)
             material_count += 1
 
             # Per-filament structure
             for fil in mat_filaments:
                 fil_path = mat_path / "filaments" / fil["slug"]
                 fil_variants = variants_by_filament.get(fil["id"], [])
+                fil_path.mkdir(parents=True, exist_ok=True)
 
-                # Filament index with variants list
-                variants_list = []
-                for var in fil_variants:
-                    var_sizes = sizes_by_variant.get(var["id"], [])
-                    variants_list.append(
-                        {
-                            "id": var["id"],
-                            "name": var["name"],
-                            "color_hex": var["color_hex"],
-                            "slug": var["slug"],
-                            "size_count": len(var_sizes),
-                            "path": f"variants/{var['slug']}.json",
-                        }
-                    )
-
-                fil_data = entity_to_dict(fil)
-                fil_data["variants"] = variants_list
-                write_json(fil_path / "index.json", fil_data)
+                fil_data = dict(exported[id(fil)])
+                fil_data["variants"] = [variant_summaries[id(var)] for var in fil_variants]
+                write_json_nomkdir(fil_path / "index.json", fil_data)
                 filament_count += 1
 
                 # Per-variant files (leaf level - includes sizes and purchase links)
                 variants_path = fil_path / "variants"
+                if fil_variants:
+                    variants_path.mkdir(exist_ok=True)
+                # Leaf paths are plain strings; open() takes them without Path parsing
+                variants_dir = str(variants_path)
                 for var in fil_variants:
                     var_sizes = sizes_by_variant.get(var["id"], [])
 
                     # Build sizes with their purchase links
                     sizes_data = []
                     for size in var_sizes:
-                        size_dict = entity_to_dict(size)
+                        size_dict = exported[id(size)]
                         size_plinks = purchase_links_by_size.get(size["id"], [])
                         if size_plinks:
-                            size_dict["purchase_links"] = [entity_to_dict(pl) for pl in size_plinks]
+                            size_dict = dict(size_dict)
+                            size_dict["purchase_links"] = [exported[id(pl)] for pl in size_plinks]
                         sizes_data.append(size_dict)
 
-                    var_data = entity_to_dict(var)
+                    var_data = dict(exported[id(var)])
                     var_data["sizes"] = sizes_data
-                    write_json(variants_path / f"{var['slug']}.json", var_data)
+                    write_json_nomkdir(f"{variants_dir}/{var['slug']}.json", var_data)
                     variant_count += 1
 
     print(
@@ -554,11 +569,17 @@ def export_api(
     )
 
     # Individual store files (just store info, no embedded purchase links)
+    stores_dir_str = str(stores_path)
     for store in db.stores:
-        store_data = entity_to_dict(store)
+        store_data = dict(exported[id(store)])
         # Add logo_slug if store has a logo
         if store["id"] in store_logo_id_mapping:
             store_data["logo_slug"] = store_logo_id_mapping[store["id"]]
-        write_json(stores_path / f"{store['slug']}.json", store_data)
+        write_json_nomkdir(f"{stores_dir_str}/{store['slug']}.json", store_data)
 
     print(f"  Written: {len(db.stores)} stores")
+
+    # Single-file bundle of everything above (badges are added later by their own step)
+    if bundle:
+        bundle_path = export_api_bundle(api_path)
+        print(f"  Written: {bundle_path}")
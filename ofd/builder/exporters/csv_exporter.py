@@ -8,7 +8,7 @@ import csv
 from pathlib import Path
 
 from ..models import Database
-from ..serialization import entity_to_dict, serialize_for_csv
+from ..serialization import memoize_json_values, serialize_for_csv
 
 # Preferred key ordering per entity type for stable CSV columns.
 # Keys not listed here are appended alphabetically after these.
@@ -63,6 +63,9 @@ _KEY_ORDER = {
 # Keys that are internal and should never appear in CSV
 _INTERNAL_KEYS = {"directory_name"}
 
+# Large buffer so big tables (sizes, purchase links) flush in few write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 def _derive_headers(entities: list[dict], entity_type: str) -> list[str]:
     """Derive CSV headers from dict keys with stable ordering."""
@@ -90,6 +93,7 @@ def _export_entity_csv(
     entity_type: str,
     output_path: Path,
     filename: str,
+    serialize_cell=serialize_for_csv,
 ) -> Path:
     """Export a list of dict entities to a CSV file."""
     csv_path = output_path / filename
@@ -100,15 +104,17 @@ def _export_entity_csv(
         return csv_path
 
     headers = _derive_headers(entities, entity_type)
+    # Rows are read straight from the crawled dicts rather than through
+    # entity_to_dict: directory_name is never a header, missing/None values
+    # serialize to "" either way, and logo_name is the crawler's logo key.
+    source_keys = ["logo" if h == "logo_name" else h for h in headers]
 
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+    with open(csv_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
         writer = csv.writer(f)
         writer.writerow(headers)
-
-        for entity in entities:
-            exported = entity_to_dict(entity)
-            row = [serialize_for_csv(exported.get(h)) for h in headers]
-            writer.writerow(row)
+        writer.writerows(
+            [serialize_cell(entity.get(k)) for k in source_keys] for entity in entities
+        )
 
     return csv_path
 
@@ -128,6 +134,7 @@ def export_csv(db: Database, output_dir: str, version: str, generated_at: str):
         (db.purchase_links, "purchase_link", "purchase_links.csv"),
     ]
 
+    serialize_cell = memoize_json_values(serialize_for_csv)
     for entities, entity_type, filename in exports:
-        csv_path = _export_entity_csv(entities, entity_type, output_path, filename)
+        csv_path = _export_entity_csv(entities, entity_type, output_path, filename, serialize_cell)
         print(f"  Written: {csv_path}")
@@ -9,7 +9,8 @@ from pathlib import Path
 
 def generate_listing_html(directory: Path, output_root: Path) -> str:
     """Generate HTML listing for a directory's contents."""
-    items = sorted(directory.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower()))
+    # Check each entry's type once and reuse it for both sorting and rendering
+    items = sorted((not p.is_dir(), p.name.lower(), p.name) for p in directory.iterdir())
 
     lines = ["<ul>"]
 
@@ -17,18 +18,14 @@ def generate_listing_html(directory: Path, output_root: Path) -> str:
     if directory != output_root:
         lines.append('<li><span class="dir"><a href="../">..</a></span></li>')
 
-    for item in items:
-        if item.name == "index.html":
+    for not_dir, _sort_name, name in items:
+        if name == "index.html":
             continue
 
-        if item.is_dir():
-            lines.append(
-                f'<li><span class="dir"><a href="{item.name}/">{item.name}/</a></span></li>'
-            )
+        if not_dir:
+            lines.append(f'<li><span class="file"><a href="{name}">{name}</a></span></li>')
         else:
-            lines.append(
-                f'<li><span class="file"><a href="{item.name}">{item.name}</a></span></li>'
-            )
+            lines.append(f'<li><span class="dir"><a href="{name}/">{name}/</a></span></li>')
 
     lines.append("</ul>")
     return "\n".join(lines)
@@ -65,8 +62,9 @@ def export_directory_listings(output_dir: str, templates_dir: str = None, **kwar
             continue
 
         # Calculate paths
-        rel_path = "/" + str(dir_path.relative_to(output_path))
-        depth = len(dir_path.relative_to(output_path).parts)
+        rel = dir_path.relative_to(output_path)
+        rel_path = "/" + str(rel)
+        depth = len(rel.parts)
         base_path = "../" * depth
         adwaita_path = base_path + "adwaita.css"
         css_path = base_path + "theme.css"
@@ -245,12 +245,12 @@ def export_html(
     adwaita_source = config_path / "adwaita.css"
     if adwaita_source.exists():
         adwaita_dest = output_path / "adwaita.css"
-        shutil.copy2(adwaita_source, adwaita_dest)
+        shutil.copyfile(adwaita_source, adwaita_dest)
         print(f"  Written: {adwaita_dest}")
 
     # Copy theme.css (application-specific overrides)
     theme_source = config_path / "theme.css"
     if theme_source.exists():
         theme_dest = output_path / "theme.css"
-        shutil.copy2(theme_source, theme_dest)
+        shutil.copyfile(theme_source, theme_dest)
         print(f"  Written: {theme_dest}")
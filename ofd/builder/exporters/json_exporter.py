@@ -8,6 +8,18 @@ from pathlib import Path
 
 from ..models import Database
 from ..serialization import entity_to_dict
+from ..utils import write_json_nomkdir
+
+# (Database attribute / all.json key, NDJSON _type) for every entity list
+_ENTITY_LISTS = [
+    ("brands", "brand"),
+    ("materials", "material"),
+    ("filaments", "filament"),
+    ("variants", "variant"),
+    ("sizes", "size"),
+    ("stores", "store"),
+    ("purchase_links", "purchase_link"),
+]
 
 
 def database_to_dict(db: Database, version: str, generated_at: str) -> dict:
@@ -25,17 +37,22 @@ def database_to_dict(db: Database, version: str, generated_at: str) -> dict:
     }
 
 
-def export_all_json(db: Database, output_dir: str, version: str, generated_at: str):
-    """Export all data to a single all.json file."""
+def export_all_json(
+    db: Database, output_dir: str, version: str, generated_at: str, data: dict | None = None
+):
+    """Export all data to a single all.json file.
+
+    ``data`` is an already converted ``database_to_dict`` result to reuse.
+    """
     output_path = Path(output_dir) / "json"
     output_path.mkdir(parents=True, exist_ok=True)
 
-    data = database_to_dict(db, version, generated_at)
+    if data is None:
+        data = database_to_dict(db, version, generated_at)
 
     # Write uncompressed JSON
     all_json_path = output_path / "all.json"
-    with open(all_json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_json_nomkdir(all_json_path, data)
     print(f"  Written: {all_json_path}")
 
     # Write gzip compressed JSON
@@ -45,11 +62,19 @@ def export_all_json(db: Database, output_dir: str, version: str, generated_at: s
     print(f"  Written: {all_json_gz_path}")
 
 
-def export_ndjson(db: Database, output_dir: str, version: str, generated_at: str):
-    """Export all data as newline-delimited JSON (NDJSON)."""
+def export_ndjson(
+    db: Database, output_dir: str, version: str, generated_at: str, data: dict | None = None
+):
+    """Export all data as newline-delimited JSON (NDJSON).
+
+    ``data`` is an already converted ``database_to_dict`` result to reuse.
+    """
     output_path = Path(output_dir) / "json"
     output_path.mkdir(parents=True, exist_ok=True)
 
+    if data is None:
+        data = database_to_dict(db, version, generated_at)
+
     ndjson_path = output_path / "all.ndjson"
     with open(ndjson_path, "w", encoding="utf-8") as f:
         # Write metadata line
@@ -57,42 +82,33 @@ def export_ndjson(db: Database, output_dir: str, version: str, generated_at: str
         f.write(json.dumps(meta, ensure_ascii=False) + "\n")
 
         # Write each entity type
-        for brand in db.brands:
-            line = {"_type": "brand", **entity_to_dict(brand)}
-            f.write(json.dumps(line, ensure_ascii=False) + "\n")
-
-        for material in db.materials:
-            line = {"_type": "material", **entity_to_dict(material)}
-            f.write(json.dumps(line, ensure_ascii=False) + "\n")
-
-        for filament in db.filaments:
-            line = {"_type": "filament", **entity_to_dict(filament)}
-            f.write(json.dumps(line, ensure_ascii=False) + "\n")
-
-        for variant in db.variants:
-            line = {"_type": "variant", **entity_to_dict(variant)}
-            f.write(json.dumps(line, ensure_ascii=False) + "\n")
-
-        for size in db.sizes:
-            line = {"_type": "size", **entity_to_dict(size)}
-            f.write(json.dumps(line, ensure_ascii=False) + "\n")
-
-        for store in db.stores:
-            line = {"_type": "store", **entity_to_dict(store)}
-            f.write(json.dumps(line, ensure_ascii=False) + "\n")
-
-        for pl in db.purchase_links:
-            line = {"_type": "purchase_link", **entity_to_dict(pl)}
-            f.write(json.dumps(line, ensure_ascii=False) + "\n")
+        for key, entity_type in _ENTITY_LISTS:
+            for exported in data[key]:
+                line = {"_type": entity_type, **exported}
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
 
     print(f"  Written: {ndjson_path}")
 
 
-def export_per_brand_json(db: Database, output_dir: str, version: str, generated_at: str):
-    """Export separate JSON files per brand."""
+def export_per_brand_json(
+    db: Database, output_dir: str, version: str, generated_at: str, data: dict | None = None
+):
+    """Export separate JSON files per brand.
+
+    ``data`` is an already converted ``database_to_dict`` result to reuse.
+    """
     output_path = Path(output_dir) / "json" / "brands"
     output_path.mkdir(parents=True, exist_ok=True)
 
+    if data is None:
+        data = database_to_dict(db, version, generated_at)
+    # Converted dict for each crawled entity, keyed by identity (dicts are unhashable)
+    exported = {
+        id(entity): converted
+        for key, _type in _ENTITY_LISTS
+        for entity, converted in zip(getattr(db, key), data[key], strict=True)
+    }
+
     # Build index
     index = {"version": version, "generated_at": generated_at, "brands": []}
 
@@ -110,18 +126,17 @@ def export_per_brand_json(db: Database, output_dir: str, version: str, generated
         brand_data = {
             "version": version,
             "generated_at": generated_at,
-            "brand": entity_to_dict(brand),
-            "materials": [entity_to_dict(m) for m in brand_materials],
-            "filaments": [entity_to_dict(f) for f in brand_filaments],
-            "variants": [entity_to_dict(v) for v in brand_variants],
-            "sizes": [entity_to_dict(s) for s in brand_sizes],
-            "purchase_links": [entity_to_dict(pl) for pl in brand_purchase_links],
+            "brand": exported[id(brand)],
+            "materials": [exported[id(m)] for m in brand_materials],
+            "filaments": [exported[id(f)] for f in brand_filaments],
+            "variants": [exported[id(v)] for v in brand_variants],
+            "sizes": [exported[id(s)] for s in brand_sizes],
+            "purchase_links": [exported[id(pl)] for pl in brand_purchase_links],
         }
 
         # Write brand JSON
         brand_json_path = output_path / f"{brand['slug']}.json"
-        with open(brand_json_path, "w", encoding="utf-8") as f:
-            json.dump(brand_data, f, indent=2, ensure_ascii=False)
+        write_json_nomkdir(brand_json_path, brand_data)
 
         # Add to index
         index["brands"].append(
@@ -135,13 +150,16 @@ def export_per_brand_json(db: Database, output_dir: str, version: str, generated
 
     # Write index
     index_path = output_path / "index.json"
-    with open(index_path, "w", encoding="utf-8") as f:
-        json.dump(index, f, indent=2, ensure_ascii=False)
+    write_json_nomkdir(index_path, index)
     print(f"  Written: {index_path} and {len(db.brands)} brand files")
 
 
 def export_json(db: Database, output_dir: str, version: str, generated_at: str):
-    """Export all JSON formats."""
-    export_all_json(db, output_dir, version, generated_at)
-    export_ndjson(db, output_dir, version, generated_at)
-    export_per_brand_json(db, output_dir, version, generated_at)
+    """Export all JSON formats.
+
+    Entities are converted once and the result is shared by all three outputs.
+    """
+    data = database_to_dict(db, version, generated_at)
+    export_all_json(db, output_dir, version, generated_at, data)
+    export_ndjson(db, output_dir, version, generated_at, data)
+    export_per_brand_json(db, output_dir, version, generated_at, data)
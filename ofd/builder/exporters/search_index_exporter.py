@@ -16,7 +16,7 @@ files the API exporter writes (e.g. brands/{brand_slug}/materials/{mat_slug}).
 from pathlib import Path
 
 from ..models import Database
-from .api_exporter import write_json
+from ..utils import write_json
 
 
 def _join_keywords(*values) -> str:
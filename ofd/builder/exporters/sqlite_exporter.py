@@ -6,19 +6,40 @@ dict-based entities with varying fields.
 """
 
 import lzma
+import shutil
 import sqlite3
+import subprocess
 from pathlib import Path
 
 from ..models import Database
 from ..serialization import insert_entities
 
+# =============================================================================
+# Connection settings for the one-shot bulk load
+# =============================================================================
+
+# The database file is deleted and rebuilt from scratch on every export, with no
+# concurrent readers, so crash safety is irrelevant: a failed build is just rerun.
+# The page size is left at SQLite's default to keep the published file format.
+BULK_LOAD_PRAGMAS = """
+PRAGMA journal_mode = OFF;
+PRAGMA synchronous = OFF;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -65536;
+PRAGMA locking_mode = EXCLUSIVE;
+"""
+
+# Read size when streaming the finished database into the xz compressor
+COMPRESS_CHUNK_SIZE = 1024 * 1024
+
 # =============================================================================
 # Schema DDL - Defines table structure, indexes, and views
 # =============================================================================
 
+# Foreign keys are declared but not enforced while loading (SQLite checks them per
+# connection, and consumers opt in with their own PRAGMA foreign_keys); the loaded
+# data is verified once with PRAGMA foreign_key_check instead.
 SCHEMA_DDL = """
-PRAGMA foreign_keys = ON;
-
 -- Metadata table
 CREATE TABLE IF NOT EXISTS meta (
     key TEXT PRIMARY KEY,
@@ -35,7 +56,6 @@ CREATE TABLE IF NOT EXISTS brand (
     origin TEXT NOT NULL,
     source TEXT
 );
-CREATE INDEX IF NOT EXISTS ix_brand_name ON brand(name);
 
 -- Material table (at brand level)
 CREATE TABLE IF NOT EXISTS material (
@@ -47,8 +67,6 @@ CREATE TABLE IF NOT EXISTS material (
     default_max_dry_temperature INTEGER,
     default_slicer_settings TEXT  -- JSON
 );
-CREATE INDEX IF NOT EXISTS ix_material_brand ON material(brand_id);
-CREATE INDEX IF NOT EXISTS ix_material_type ON material(material);
 
 -- Filament table
 CREATE TABLE IF NOT EXISTS filament (
@@ -78,9 +96,6 @@ CREATE TABLE IF NOT EXISTS filament (
     discontinued INTEGER NOT NULL DEFAULT 0,
     slicer_settings TEXT  -- JSON
 );
-CREATE INDEX IF NOT EXISTS ix_filament_brand ON filament(brand_id);
-CREATE INDEX IF NOT EXISTS ix_filament_material ON filament(material_id);
-CREATE INDEX IF NOT EXISTS ix_filament_slug ON filament(slug);
 
 -- Variant table
 CREATE TABLE IF NOT EXISTS variant (
@@ -94,9 +109,6 @@ CREATE TABLE IF NOT EXISTS variant (
     traits TEXT,  -- JSON
     discontinued INTEGER NOT NULL DEFAULT 0
 );
-CREATE INDEX IF NOT EXISTS ix_variant_filament ON variant(filament_id);
-CREATE INDEX IF NOT EXISTS ix_variant_slug ON variant(slug);
-CREATE INDEX IF NOT EXISTS ix_variant_name ON variant(name);
 
 -- Size table (spool size/SKU)
 CREATE TABLE IF NOT EXISTS size (
@@ -113,9 +125,6 @@ CREATE TABLE IF NOT EXISTS size (
     qr_identifier TEXT,
     discontinued INTEGER NOT NULL DEFAULT 0
 );
-CREATE INDEX IF NOT EXISTS ix_size_variant ON size(variant_id);
-CREATE INDEX IF NOT EXISTS ix_size_gtin ON size(gtin);
-CREATE INDEX IF NOT EXISTS ix_size_weight ON size(filament_weight);
 
 -- Store table
 CREATE TABLE IF NOT EXISTS store (
@@ -127,7 +136,6 @@ CREATE TABLE IF NOT EXISTS store (
     ships_from TEXT NOT NULL,  -- JSON array
     ships_to TEXT NOT NULL  -- JSON array
 );
-CREATE INDEX IF NOT EXISTS ix_store_name ON store(name);
 
 -- Purchase link table
 CREATE TABLE IF NOT EXISTS purchase_link (
@@ -139,8 +147,6 @@ CREATE TABLE IF NOT EXISTS purchase_link (
     ships_from TEXT,  -- JSON array (override)
     ships_to TEXT  -- JSON array (override)
 );
-CREATE INDEX IF NOT EXISTS ix_purchase_link_size ON purchase_link(size_id);
-CREATE INDEX IF NOT EXISTS ix_purchase_link_store ON purchase_link(store_id);
 
 -- Useful views
 CREATE VIEW IF NOT EXISTS v_full_variant AS
@@ -208,12 +214,86 @@ JOIN filament f ON v.filament_id = f.id
 JOIN brand b ON f.brand_id = b.id;
 """
 
+# Secondary indexes, created after the bulk insert so each B-tree is built once
+# from the loaded rows instead of being updated row by row.
+SCHEMA_INDEXES_DDL = """
+-- Brand indexes
+CREATE INDEX IF NOT EXISTS ix_brand_name ON brand(name);
+
+-- Material indexes
+CREATE INDEX IF NOT EXISTS ix_material_brand ON material(brand_id);
+CREATE INDEX IF NOT EXISTS ix_material_type ON material(material);
+
+-- Filament indexes
+CREATE INDEX IF NOT EXISTS ix_filament_brand ON filament(brand_id);
+CREATE INDEX IF NOT EXISTS ix_filament_material ON filament(material_id);
+CREATE INDEX IF NOT EXISTS ix_filament_slug ON filament(slug);
+
+-- Variant indexes
+CREATE INDEX IF NOT EXISTS ix_variant_filament ON variant(filament_id);
+CREATE INDEX IF NOT EXISTS ix_variant_slug ON variant(slug);
+CREATE INDEX IF NOT EXISTS ix_variant_name ON variant(name);
+
+-- Size indexes
+CREATE INDEX IF NOT EXISTS ix_size_variant ON size(variant_id);
+CREATE INDEX IF NOT EXISTS ix_size_gtin ON size(gtin);
+CREATE INDEX IF NOT EXISTS ix_size_weight ON size(filament_weight);
+
+-- Store indexes
+CREATE INDEX IF NOT EXISTS ix_store_name ON store(name);
+
+-- Purchase link indexes
+CREATE INDEX IF NOT EXISTS ix_purchase_link_size ON purchase_link(size_id);
+CREATE INDEX IF NOT EXISTS ix_purchase_link_store ON purchase_link(store_id);
+"""
+
+
+def split_sql_script(script: str) -> list[str]:
+    """Split a SQL script into its individual statements (comments stay attached)."""
+    statements = []
+    pending = ""
+    for line in script.splitlines(keepends=True):
+        pending += line
+        if sqlite3.complete_statement(pending):
+            statements.append(pending.strip())
+            pending = ""
+    return statements
+
+
+# Pre-split so the schema can run statement by statement inside the load
+# transaction (executescript always commits any open transaction first)
+SCHEMA_STATEMENTS = split_sql_script(SCHEMA_DDL)
+SCHEMA_INDEX_STATEMENTS = split_sql_script(SCHEMA_INDEXES_DDL)
 
 # =============================================================================
 # Main Export Function
 # =============================================================================
 
 
+def compress_xz(path: Path) -> Path:
+    """
+    Write ``<path>.xz`` next to ``path``, keeping the original.
+
+    Uses the xz CLI with one thread per core when it is installed (same preset as
+    the lzma module's default); otherwise streams through the single-threaded
+    stdlib encoder.
+    """
+    xz_path = path.with_name(f"{path.name}.xz")
+    xz = shutil.which("xz")
+    if xz:
+        subprocess.run([xz, "-T0", "-6", "--keep", "--force", path], check=True)
+        return xz_path
+
+    # Read into one reusable buffer rather than allocating a new chunk per read
+    buffer = bytearray(COMPRESS_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb") as f_in:
+        with lzma.open(xz_path, "wb") as f_out:
+            while n := f_in.readinto(buffer):
+                f_out.write(view[:n])
+    return xz_path
+
+
 def export_sqlite(db: Database, output_dir: str, version: str, generated_at: str):
     """Export database to SQLite format."""
     output_path = Path(output_dir) / "sqlite"
@@ -225,33 +305,50 @@ def export_sqlite(db: Database, output_dir: str, version: str, generated_at: str
     if db_path.exists():
         db_path.unlink()
 
-    # Create database
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
+    # Create database; transactions are managed explicitly below
+    conn = sqlite3.connect(db_path, isolation_level=None)
+
+    conn.executescript(BULK_LOAD_PRAGMAS)
 
-    # Create schema
-    cursor.executescript(SCHEMA_DDL)
+    # Create the schema and load all rows in a single transaction
+    conn.execute("BEGIN")
+    for statement in SCHEMA_STATEMENTS:
+        conn.execute(statement)
 
     # Insert metadata
-    cursor.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("version", version))
-    cursor.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("generated_at", generated_at))
+    conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("version", version))
+    conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("generated_at", generated_at))
 
     # Insert all entities using PRAGMA-driven column matching
-    insert_entities(cursor, db.brands, "brand")
-    insert_entities(cursor, db.materials, "material")
-    insert_entities(cursor, db.filaments, "filament")
-    insert_entities(cursor, db.variants, "variant")
-    insert_entities(cursor, db.sizes, "size")
-    insert_entities(cursor, db.stores, "store")
-    insert_entities(cursor, db.purchase_links, "purchase_link")
-
-    conn.commit()
+    insert_entities(conn, db.brands, "brand")
+    insert_entities(conn, db.materials, "material")
+    insert_entities(conn, db.filaments, "filament")
+    insert_entities(conn, db.variants, "variant")
+    insert_entities(conn, db.sizes, "size")
+    insert_entities(conn, db.stores, "store")
+    insert_entities(conn, db.purchase_links, "purchase_link")
+
+    # Verify all references in one pass instead of probing parents on every insert
+    violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+    if violations:
+        # With journaling off a half-loaded file may be left behind; never ship it
+        conn.execute("ROLLBACK")
+        conn.close()
+        db_path.unlink(missing_ok=True)
+        table, rowid, parent, _ = violations[0]
+        raise sqlite3.IntegrityError(
+            f"{len(violations)} foreign key violation(s) in {db_path}, "
+            f"first: {table} row {rowid} references a missing {parent}"
+        )
+
+    # Build secondary indexes over the loaded tables
+    for statement in SCHEMA_INDEX_STATEMENTS:
+        conn.execute(statement)
+
+    conn.execute("COMMIT")
     conn.close()
     print(f"  Written: {db_path}")
 
     # Create compressed version
-    db_xz_path = output_path / "filaments.db.xz"
-    with open(db_path, "rb") as f_in:
-        with lzma.open(db_xz_path, "wb") as f_out:
-            f_out.write(f_in.read())
+    db_xz_path = compress_xz(db_path)
     print(f"  Written: {db_xz_path}")
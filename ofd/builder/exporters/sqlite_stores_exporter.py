@@ -5,12 +5,12 @@ Creates a separate database file containing just store information,
 making it easier to work with store data independently.
 """
 
-import lzma
 import sqlite3
 from pathlib import Path
 
 from ..models import Database
 from ..serialization import insert_entities
+from .sqlite_exporter import BULK_LOAD_PRAGMAS, compress_xz
 
 # =============================================================================
 # Schema DDL - Stores database schema
@@ -67,30 +67,30 @@ def export_sqlite_stores(db: Database, output_dir: str, version: str, generated_
     if db_path.exists():
         db_path.unlink()
 
-    # Create database
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    # Create database; transactions are managed explicitly below
+    conn = sqlite3.connect(db_path, isolation_level=None)
 
     # Create schema
-    cursor.executescript(STORES_SCHEMA_DDL)
+    conn.executescript(BULK_LOAD_PRAGMAS)
+    conn.executescript(STORES_SCHEMA_DDL)
+
+    # Load all rows in a single transaction (one journal sync at COMMIT)
+    conn.execute("BEGIN")
 
     # Insert metadata
-    cursor.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("version", version))
-    cursor.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("generated_at", generated_at))
-    cursor.execute(
+    conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("version", version))
+    conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("generated_at", generated_at))
+    conn.execute(
         "INSERT INTO meta (key, value) VALUES (?, ?)", ("store_count", str(len(db.stores)))
     )
 
     # Insert stores using PRAGMA-driven column matching
-    insert_entities(cursor, db.stores, "store")
+    insert_entities(conn, db.stores, "store")
 
-    conn.commit()
+    conn.execute("COMMIT")
     conn.close()
     print(f"  Written: {db_path} ({len(db.stores)} stores)")
 
     # Create compressed version
-    db_xz_path = output_path / "stores.db.xz"
-    with open(db_path, "rb") as f_in:
-        with lzma.open(db_xz_path, "wb") as f_out:
-            f_out.write(f_in.read())
+    db_xz_path = compress_xz(db_path)
     print(f"  Written: {db_xz_path}")
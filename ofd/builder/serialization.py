@@ -5,7 +5,10 @@ Works with plain dict entities — no dataclass introspection needed.
 """
 
 import json
+import math
 import sqlite3
+from collections.abc import Callable
+from itertools import chain
 from typing import Any
 
 from ofd.builder.models import ENTITY_TYPES
@@ -18,11 +21,16 @@ def entity_to_dict(entity: Any, exclude_none: bool = True) -> dict | None:
     - Strips 'directory_name' (internal-only field added by crawler for brands/stores)
     - Renames 'logo' to 'logo_name' for entities that have 'directory_name'
     - Optionally strips None values
+
+    When none of that applies the entity itself is returned rather than a copy,
+    so callers must copy the result before adding keys to it.
     """
     if entity is None:
         return None
     if not isinstance(entity, dict):
         return entity
+    if "directory_name" not in entity and (not exclude_none or None not in entity.values()):
+        return entity
 
     # Detect brand/store by presence of directory_name (only those entity types have it)
     is_brand_or_store = "directory_name" in entity
@@ -44,14 +52,21 @@ def entity_to_dict(entity: Any, exclude_none: bool = True) -> dict | None:
     return result
 
 
+_CSV_BOOL = {True: "1", False: "0"}
+
+# json.dumps builds a new JSONEncoder whenever non-default options are passed;
+# one shared encoder gives identical output without that per-cell setup.
+_encode_json_cell = json.JSONEncoder(ensure_ascii=False).encode
+
+
 def serialize_for_csv(value: Any) -> str:
     """Serialize a value for CSV output."""
     if value is None:
         return ""
     if isinstance(value, bool):
-        return "1" if value else "0"
+        return _CSV_BOOL[value]
     if isinstance(value, (dict, list)):
-        return json.dumps(value, ensure_ascii=False)
+        return _encode_json_cell(value)
     return str(value)
 
 
@@ -62,20 +77,73 @@ def serialize_for_sqlite(value: Any) -> Any:
     if isinstance(value, bool):
         return 1 if value else 0
     if isinstance(value, (dict, list)):
-        return json.dumps(value, ensure_ascii=False)
+        return _encode_json_cell(value)
     return value
 
 
-def get_table_columns(cursor: sqlite3.Cursor, table_name: str) -> list[str]:
+def _content_key(value: dict | list):
+    """Hashable key for a flat dict/list, or None if it holds nested containers.
+
+    Types are part of the key so that True, 1 and 1.0 never share a cache slot,
+    and floats carry their sign so that 0.0 and -0.0 stay apart.
+    """
+    items = value.items() if isinstance(value, dict) else enumerate(value)
+    key = []
+    for k, v in items:
+        if isinstance(v, (dict, list)):
+            return None
+        if type(v) is float:
+            key.append((k, float, v, math.copysign(1.0, v)))
+        else:
+            key.append((k, type(v), v))
+    return (type(value), tuple(key))
+
+
+def memoize_json_values(serialize: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Wrap a cell serializer so repeated dict/list values are JSON-encoded once.
+
+    Variants share a small set of traits/color_standards blobs, so most JSON
+    cells are serialized once. Values are looked up by identity first (the
+    entities keep them alive for the whole export), then by content.
+    """
+    by_id: dict[int, Any] = {}
+    by_content: dict[tuple, Any] = {}
+
+    def serialize_cached(value):
+        if not isinstance(value, (dict, list)):
+            return serialize(value)
+        cell = by_id.get(id(value))
+        if cell is None:
+            key = _content_key(value)
+            cell = by_content.get(key) if key is not None else None
+            if cell is None:
+                cell = serialize(value)
+                if key is not None:
+                    by_content[key] = cell
+            by_id[id(value)] = cell
+        return cell
+
+    return serialize_cached
+
+
+# SQLITE_MAX_VARIABLE_NUMBER of SQLite builds before 3.32; newer builds allow more
+_MAX_BOUND_PARAMETERS = 999
+
+# Values sqlite3 binds as-is (bools bind as the integers 1/0); everything else
+# goes through serialize_for_sqlite
+_SQLITE_NATIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def get_table_columns(conn: sqlite3.Connection, table_name: str) -> list[str]:
     """Get column names for a table from the SQLite schema."""
     if table_name not in ENTITY_TYPES:
         raise ValueError(f"Unknown table name: {table_name}")
-    cursor.execute(f"PRAGMA table_info({table_name})")
-    return [row[1] for row in cursor.fetchall()]
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table_name})")]
 
 
 def insert_entities(
-    cursor: sqlite3.Cursor,
+    conn: sqlite3.Connection,
     entities: list[dict],
     table_name: str,
 ):
@@ -92,12 +160,41 @@ def insert_entities(
     if table_name not in ENTITY_TYPES:
         raise ValueError(f"Unknown table name: {table_name}")
 
-    columns = get_table_columns(cursor, table_name)
-    placeholders = ", ".join(["?"] * len(columns))
+    columns = get_table_columns(conn, table_name)
+    row_placeholders = "(" + ", ".join(["?"] * len(columns)) + ")"
     col_names = ", ".join(columns)
-    sql = f"INSERT INTO {table_name} ({col_names}) VALUES ({placeholders})"
-
-    for entity in entities:
-        exported = entity_to_dict(entity)
-        values = tuple(serialize_for_sqlite(exported.get(col)) for col in columns)
-        cursor.execute(sql, values)
+    insert_prefix = f"INSERT INTO {table_name} ({col_names}) VALUES "
+
+    # Map each column to its key in the crawled dict once per table, instead of
+    # running entity_to_dict per row: directory_name is never a column, missing and
+    # None values both bind NULL, and logo_name is the crawler's logo key.
+    source_keys = ["logo" if col == "logo_name" else col for col in columns]
+    serialize = memoize_json_values(serialize_for_sqlite)
+
+    # Rows are built up front (no generator frames to resume). Each row is a plain
+    # C-level projection of the dict; only rows holding JSON values (or other
+    # non-native types) are revisited in Python to serialize those cells.
+    rows = [list(map(entity.get, source_keys)) for entity in entities]
+    for row in rows:
+        if not _SQLITE_NATIVE_TYPES.issuperset(map(type, row)):
+            row[:] = [v if type(v) in _SQLITE_NATIVE_TYPES else serialize(v) for v in row]
+
+    # Insert several rows per statement (multi-row VALUES), staying under SQLite's
+    # bound-parameter limit. Full batches share one prepared statement through
+    # executemany; the remainder goes in a final, shorter INSERT.
+    batch_size = max(1, _MAX_BOUND_PARAMETERS // len(columns))
+    full_count = len(rows) - len(rows) % batch_size
+    if full_count:
+        conn.executemany(
+            insert_prefix + ", ".join([row_placeholders] * batch_size),
+            (
+                list(chain.from_iterable(rows[start : start + batch_size]))
+                for start in range(0, full_count, batch_size)
+            ),
+        )
+    if full_count < len(rows):
+        remainder = rows[full_count:]
+        conn.execute(
+            insert_prefix + ", ".join([row_placeholders] * len(remainder)),
+            list(chain.from_iterable(remainder)),
+        )
@@ -8,10 +8,21 @@ UUID Generation follows the OFD standard specification:
 """
 
 import hashlib
+import json
+import os
 import re
 import subprocess
 import uuid
 from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Buffer size for JSON writes (most API files are well under this)
+WRITE_BUFFER_SIZE = 64 * 1024
 
 # =============================================================================
 # UUID Namespaces (from OPT specification)
@@ -55,24 +66,22 @@ def _derive_uuid(namespace: uuid.UUID, *args: bytes | str | uuid.UUID) -> uuid.U
     Returns:
         Derived UUID
     """
-    # Build the name by concatenating all args
-    parts = []
+    # uuid.uuid5 expects a string, but the name is a binary concatenation, so
+    # hash namespace + args directly. Feeding each part to the hash avoids
+    # building the joined name (and namespace + name) as throwaway bytes.
+    sha = hashlib.sha1(namespace.bytes)
     for arg in args:
         if isinstance(arg, bytes):
-            parts.append(arg)
+            sha.update(arg)
         elif isinstance(arg, uuid.UUID):
-            parts.append(arg.bytes)
+            sha.update(arg.bytes)
         elif isinstance(arg, str):
-            parts.append(arg.encode("utf-8"))
+            sha.update(arg.encode("utf-8"))
         else:
             # Convert to string and encode
-            parts.append(str(arg).encode("utf-8"))
+            sha.update(str(arg).encode("utf-8"))
 
-    name = b"".join(parts)
-    # uuid.uuid5 expects a string, but we have bytes from concatenation
-    # We need to use the underlying implementation directly
-    hash_value = hashlib.sha1(namespace.bytes + name).digest()
-    return uuid.UUID(bytes=hash_value[:16], version=5)
+    return uuid.UUID(bytes=sha.digest()[:16], version=5)
 
 
 def generate_brand_uuid(brand_name: str) -> str:
@@ -245,6 +254,16 @@ def generate_purchase_link_id(size_id: str, store_id: str, url: str) -> str:
 # String Utilities
 # =============================================================================
 
+# Compiled once: slugify and normalize_color_hex run for every crawled entity
+_SLUG_SEPARATORS = re.compile(r"[\s\-]+")
+_SLUG_INVALID_CHARS = re.compile(r"[^a-z0-9_+]")
+_SLUG_REPEATED_UNDERSCORES = re.compile(r"_+")
+
+_HEX6_WITH_HASH = re.compile(r"^#[0-9A-Fa-f]{6}$")
+_HEX3_WITH_HASH = re.compile(r"^#[0-9A-Fa-f]{3}$")
+_HEX6 = re.compile(r"^[0-9A-Fa-f]{6}$")
+_HEX3 = re.compile(r"^[0-9A-Fa-f]{3}$")
+
 
 def slugify(text: str) -> str:
     """Convert text to a slug that matches the schema id pattern: ^[a-z0-9+]+(_[a-z0-9+]+)*$
@@ -255,11 +274,11 @@ def slugify(text: str) -> str:
     # Convert to lowercase
     text = text.lower()
     # Replace spaces and hyphens with underscores
-    text = re.sub(r"[\s\-]+", "_", text)
+    text = _SLUG_SEPARATORS.sub("_", text)
     # Remove non-alphanumeric characters except underscores and plus
-    text = re.sub(r"[^a-z0-9_+]", "", text)
+    text = _SLUG_INVALID_CHARS.sub("", text)
     # Remove consecutive underscores
-    text = re.sub(r"_+", "_", text)
+    text = _SLUG_REPEATED_UNDERSCORES.sub("_", text)
     # Strip leading/trailing underscores
     text = text.strip("_")
     return text
@@ -280,19 +299,19 @@ def normalize_color_hex(color: str) -> str | None:
     color = str(color).strip()
 
     # If already in correct format, return as-is
-    if re.match(r"^#[0-9A-Fa-f]{6}$", color):
+    if _HEX6_WITH_HASH.match(color):
         return color.upper()
 
     # Handle 3-digit hex
-    if re.match(r"^#[0-9A-Fa-f]{3}$", color):
+    if _HEX3_WITH_HASH.match(color):
         r, g, b = color[1], color[2], color[3]
         return f"#{r}{r}{g}{g}{b}{b}".upper()
 
     # Handle hex without #
-    if re.match(r"^[0-9A-Fa-f]{6}$", color):
+    if _HEX6.match(color):
         return f"#{color}".upper()
 
-    if re.match(r"^[0-9A-Fa-f]{3}$", color):
+    if _HEX3.match(color):
         r, g, b = color[0], color[1], color[2]
         return f"#{r}{r}{g}{g}{b}{b}".upper()
 
@@ -330,10 +349,63 @@ def calculate_sha256(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
-def calculate_file_sha256(filepath: str) -> str:
-    """Calculate SHA256 hash of a file."""
+def calculate_file_sha256(filepath: str | os.PathLike[str]) -> str:
+    """Calculate SHA256 hash of a file, reading it in 1 MiB chunks."""
+    sha = hashlib.sha256()
     with open(filepath, "rb") as f:
-        return hashlib.sha256(f.read()).hexdigest()
+        while chunk := f.read(1 << 20):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+# =============================================================================
+# JSON / Filesystem Utilities
+# =============================================================================
+
+
+def load_json_bytes(data: bytes | str):
+    """Parse JSON text, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the same exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def subdirs(path: str | Path, skip_hidden: bool = False) -> list[Path]:
+    """Return the child directories of ``path``, sorted by name.
+
+    ``os.scandir`` reports each entry's type from the directory listing, so
+    no child is stat'ed.
+    """
+    with os.scandir(path) as it:
+        names = sorted(
+            entry.name
+            for entry in it
+            if entry.is_dir() and not (skip_hidden and entry.name.startswith("."))
+        )
+    return [Path(path, name) for name in names]
+
+
+def write_json(path: Path, data: dict):
+    """Write JSON file with consistent formatting, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json_nomkdir(path, data)
+
+
+def write_json_nomkdir(path: str | Path, data: dict):
+    """Write JSON file into a directory the caller has already created."""
+    if orjson is not None:
+        # Same bytes as the json.dump call below, encoded in C
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    # json.dump streams small chunks; a larger buffer keeps big index files to a
+    # handful of write() calls while leaf files still go out in a single write.
+    with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
 
 
 # =============================================================================
@@ -6,7 +6,6 @@ JSON, SQLite, CSV, API, and HTML exports.
 """
 
 import argparse
-import hashlib
 import json
 import sys
 from datetime import datetime, timezone
@@ -24,7 +23,7 @@ from ofd.builder.exporters import (
     export_sqlite,
     export_sqlite_stores,
 )
-from ofd.builder.utils import get_current_timestamp, get_git_commit
+from ofd.builder.utils import calculate_file_sha256, get_current_timestamp, get_git_commit
 
 project_root = Path(__file__).parent.parent.parent
 
@@ -43,9 +42,7 @@ def calculate_checksums(output_dir: str) -> dict[str, str]:
     for file_path in output_path.rglob("*"):
         if file_path.is_file() and not file_path.name.endswith(".sha256"):
             rel_path = str(file_path.relative_to(output_path))
-            with open(file_path, "rb") as f:
-                sha256 = hashlib.sha256(f.read()).hexdigest()
-            checksums[rel_path] = sha256
+            checksums[rel_path] = calculate_file_sha256(file_path)
 
     return checksums
 
@@ -87,6 +84,7 @@ Examples:
   ofd build -o output              Build to custom output directory
   ofd build --skip-sqlite          Skip SQLite export
   ofd build --skip-json --skip-csv Only build API and HTML
+  ofd build --bundle               Also pack the static API into api/v1.tar.gz
         """,
     )
 
@@ -116,6 +114,13 @@ Examples:
         "--skip-html", action="store_true", help="Skip HTML landing page export"
     )
 
+    # Extra outputs
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Also pack the static API into api/v1.tar.gz (badges are not included)",
+    )
+
     parser.set_defaults(func=run_build)
 
 
@@ -213,6 +218,7 @@ def run_build(args: argparse.Namespace) -> int:
             data_dir=str(data_dir),
             stores_dir=str(stores_dir),
             commit=commit,
+            bundle=args.bundle,
         )
     else:
         print("\n[6/9] Skipping Static API export")
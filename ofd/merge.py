@@ -18,25 +18,38 @@ Safety guarantees:
 """
 
 import json
+import os
 import shutil
 from pathlib import Path
 from typing import Any
 
+from ofd.builder.utils import load_json_bytes
+
 
 def load_json(path: Path) -> Any | None:
-    """Load JSON with error handling."""
+    """Load JSON with error handling (see load_json_bytes)."""
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return load_json_bytes(f.read())
     except (json.JSONDecodeError, OSError):
         return None
 
 
 def save_json(path: Path, data: Any) -> None:
-    """Save JSON with consistent 2-space formatting."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    """Save JSON with consistent 2-space formatting.
+
+    Writes a sibling temp file and renames it over *path*, so an interrupted
+    run never leaves a truncated data file behind. The temp file is removed
+    if anything fails before the rename.
+    """
+    content = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def merge_dicts(existing: dict, new: dict) -> dict:
@@ -81,7 +94,15 @@ def merge_json_file(target: Path, source: Path) -> bool:
     source_data = load_json(source)
     if source_data is None:
         return False
+    return _merge_json_data(target, source_data)
 
+
+def _merge_json_data(target: Path, source_data: Any) -> bool:
+    """Merge already-loaded source data into the target JSON file.
+
+    Shared by merge_json_file and merge_trees, which has parsed the source
+    already and should not read it twice.
+    """
     if not target.exists():
         save_json(target, source_data)
         return True
@@ -177,7 +198,7 @@ def merge_trees(target_dir: Path, source_dir: Path, dry_run: bool = False) -> li
                         if merged != target_data:
                             actions.append(f"Would merge: {rel}")
                 else:
-                    if merge_json_file(target_path, source_path):
+                    if _merge_json_data(target_path, source_data):
                         actions.append(f"Merged: {rel}")
         else:
             # Non-JSON files (logos, etc.) - copy only if missing
@@ -10,7 +10,7 @@ merge_trees utility, and optionally deleted.
 Detection strategy:
 - **Word-swap groups**: filament dirs within the same material folder
   whose underscore-separated words form the same multiset
-  (``collections.Counter``).  E.g. ``cf_pla`` and ``pla_cf``.
+  (compared as sorted word tuples).  E.g. ``cf_pla`` and ``pla_cf``.
 - **Doubled modifiers**: filament dirs with consecutive repeated
   segments.  E.g. ``pla_cf_cf`` → ``pla_cf``.
 - **Material-type redundancy**: filament dirs that include the parent
@@ -32,6 +32,9 @@ Examples:
     # Preview what would be merged
     ofd script deduplicate_data --dry-run
 
+    # Only count detected duplicates (no git lookups or merge plan)
+    ofd script deduplicate_data --summary
+
     # Merge and delete duplicate sources
     ofd script deduplicate_data --delete-source
 
@@ -40,13 +43,15 @@ Examples:
 """
 
 import argparse
+import errno
 import json
 import shutil
 import subprocess
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ofd.base import BaseScript, ScriptResult, register_script
+from ofd.builder.utils import subdirs
 from ofd.merge import merge_has_errors, merge_trees, save_json
 
 
@@ -153,28 +158,30 @@ class DeduplicateDataScript(BaseScript):
             action="store_true",
             help="Preview detected duplicates and planned merges without modifying files",
         )
+        parser.add_argument(
+            "--summary",
+            action="store_true",
+            help="Only count detected duplicates; skips git history lookups and merge planning",
+        )
 
     def run(self, args: argparse.Namespace) -> ScriptResult:
         dry_run = getattr(args, "dry_run", False)
         delete_source = getattr(args, "delete_source", False)
         brand_filter = getattr(args, "brand", None)
+        summary = getattr(args, "summary", False)
 
         # ── 1. Collect filament dirs ────────────────────────────────
-        brand_dirs = sorted(self.data_dir.iterdir())
+        brands = subdirs(self.data_dir)
         if brand_filter:
-            brand_dirs = [d for d in brand_dirs if d.name == brand_filter]
-            if not brand_dirs:
+            brands = [b for b in brands if b.name == brand_filter]
+            if not brands:
                 return ScriptResult(success=False, message=f"Brand not found: {brand_filter}")
 
         # mat_path -> [filament_dir_name, ...]
         filament_dirs: dict[Path, list[str]] = {}
-        for brand in brand_dirs:
-            if not brand.is_dir():
-                continue
-            for mat in sorted(brand.iterdir()):
-                if not mat.is_dir():
-                    continue
-                names = sorted(d.name for d in mat.iterdir() if d.is_dir())
+        for brand in brands:
+            for mat in subdirs(brand):
+                names = [d.name for d in subdirs(mat)]
                 if names:
                     filament_dirs[mat] = names
 
@@ -183,7 +190,7 @@ class DeduplicateDataScript(BaseScript):
         for mat_path, names in filament_dirs.items():
             buckets: dict[tuple, list[str]] = {}
             for n in names:
-                key = tuple(sorted(Counter(n.split("_")).items()))
+                key = tuple(sorted(n.split("_")))
                 buckets.setdefault(key, []).append(n)
             for _key, grp in buckets.items():
                 if len(grp) > 1:
@@ -191,15 +198,15 @@ class DeduplicateDataScript(BaseScript):
 
         # ── 3. Detect standalone doubled-modifier dirs ──────────────
         # (not already part of a word-swap group)
-        in_group: set[str] = set()
+        in_group: set[tuple[Path, str]] = set()
         for mat_path, grp in groups:
             for n in grp:
-                in_group.add(str(mat_path / n))
+                in_group.add((mat_path, n))
 
         doubled_standalone: list[tuple[Path, str]] = []
         for mat_path, names in filament_dirs.items():
             for n in names:
-                if str(mat_path / n) not in in_group and _has_doubled_segment(n):
+                if (mat_path, n) not in in_group and _has_doubled_segment(n):
                     doubled_standalone.append((mat_path, n))
 
         # ── 4. Detect material-type-redundant pairs ────────────────
@@ -210,7 +217,7 @@ class DeduplicateDataScript(BaseScript):
             material = mat_path.name.lower()
             name_set = set(names)
             for n in names:
-                if str(mat_path / n) in in_group:
+                if (mat_path, n) in in_group:
                     continue
                 stripped = _strip_material_type(n, material)
                 if stripped is not None and stripped in name_set and stripped != n:
@@ -220,18 +227,42 @@ class DeduplicateDataScript(BaseScript):
             self.log("No duplicates found.")
             return ScriptResult(success=True, message="No duplicates found")
 
+        found = (
+            f"Found {len(groups)} word-swap group(s), "
+            f"{len(doubled_standalone)} doubled-modifier dir(s), "
+            f"{len(material_redundant)} material-type-redundant pair(s)"
+        )
+        if summary:
+            self.log(found)
+            return ScriptResult(
+                success=True,
+                message=found,
+                data={
+                    "word_swap_groups": len(groups),
+                    "doubled_modifiers": len(doubled_standalone),
+                    "material_redundant": len(material_redundant),
+                },
+            )
+
         # ── 4. Plan merges ──────────────────────────────────────────
         # For each group: pick canonical target, merge others into it.
         # For doubled standalone: rename to clean name (merge if clean exists).
         merge_plan: list[tuple[Path, Path]] = []  # (source, target)
         rename_plan: list[tuple[Path, Path]] = []  # (old, new) for doubled-only
 
+        # Each age lookup is a separate `git log` process; run them concurrently.
+        candidates = [str(mat_path / n) for mat_path, grp in groups for n in grp]
+        with ThreadPoolExecutor() as pool:
+            first_commit = dict(
+                zip(candidates, pool.map(_git_first_commit_timestamp, candidates), strict=True)
+            )
+
         for mat_path, grp in groups:
             # Sort by: git age (oldest first), no doubled segments, shorter, alpha
             grp_scored = sorted(
                 grp,
                 key=lambda n: (
-                    _git_first_commit_timestamp(str(mat_path / n)),
+                    first_commit[str(mat_path / n)],
                     _has_doubled_segment(n),
                     len(n),
                     n,
@@ -267,22 +298,21 @@ class DeduplicateDataScript(BaseScript):
             merge_plan.append((mat_path / source_name, mat_path / target_name))
 
         # ── 6. Report plan ──────────────────────────────────────────
-        self.log(
-            f"Found {len(groups)} word-swap group(s), "
-            f"{len(doubled_standalone)} doubled-modifier dir(s), "
-            f"{len(material_redundant)} material-type-redundant pair(s)"
-        )
+        self.log(found)
         self.log("")
 
         if merge_plan:
             self.log(f"{'Planned' if dry_run else 'Executing'} {len(merge_plan)} merge(s):")
-            for src, tgt in merge_plan:
-                self.log(f"  {src.relative_to(self.data_dir)} -> {tgt.relative_to(self.data_dir)}")
+            self.log_lines(
+                f"  {src.relative_to(self.data_dir)} -> {tgt.relative_to(self.data_dir)}"
+                for src, tgt in merge_plan
+            )
 
         if rename_plan:
             self.log(f"\n{'Planned' if dry_run else 'Executing'} {len(rename_plan)} rename(s):")
-            for old, new in rename_plan:
-                self.log(f"  {old.relative_to(self.data_dir)} -> {new.name}")
+            self.log_lines(
+                f"  {old.relative_to(self.data_dir)} -> {new.name}" for old, new in rename_plan
+            )
 
         if dry_run:
             total = len(merge_plan) + len(rename_plan)
@@ -303,8 +333,7 @@ class DeduplicateDataScript(BaseScript):
             self.log(f"\nMerging: {src.name} -> {tgt.name}")
             actions = merge_trees(tgt, src)
             all_actions.extend(actions)
-            for a in actions:
-                self.log(f"  {a}")
+            self.log_lines(f"  {a}" for a in actions)
             if not actions:
                 self.log("  No changes needed")
 
@@ -320,11 +349,21 @@ class DeduplicateDataScript(BaseScript):
 
         # ── 7. Execute renames ──────────────────────────────────────
         rename_ok = 0
+        rename_collisions = 0
         for old, new in rename_plan:
-            if not old.exists():
+            # Rename directly instead of checking first: two doubled names can
+            # clean to the same target, and the OS reports that atomically.
+            try:
+                old.rename(new)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                    raise
+                self.log(f"\nNot renamed: {old.name} -> {new.name} (target already exists)")
+                rename_collisions += 1
                 continue
             self.log(f"\nRenaming: {old.name} -> {new.name}")
-            old.rename(new)
 
             # Update the id field in filament.json
             filament_json = new / "filament.json"
@@ -349,6 +388,8 @@ class DeduplicateDataScript(BaseScript):
         )
         if rename_ok:
             self.log(f"Renames: {rename_ok}")
+        if rename_collisions:
+            self.log(f"Renames skipped (target exists): {rename_collisions}")
 
         return ScriptResult(
             success=merge_fail == 0,
@@ -357,5 +398,6 @@ class DeduplicateDataScript(BaseScript):
                 "merges": merge_ok,
                 "merge_errors": merge_fail,
                 "renames": rename_ok,
+                "rename_collisions": rename_collisions,
             },
         )
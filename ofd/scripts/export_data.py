@@ -42,7 +42,7 @@ def normalize_color_hex(input_data: list[str]) -> list[str]:
     """Takes a list of color hex values and normalizes them."""
     res: list[str] = []
     for item in input_data:
-        match = re.fullmatch(COLOR_HEX_PATTERN, item.strip())
+        match = COLOR_HEX_PATTERN.fullmatch(item.strip())
         if match:
             res.append(match.group(1).upper())
         else:
@@ -281,7 +281,7 @@ class ExportDataScript(BaseScript):
                     if logo_src.exists():
                         import shutil
 
-                        shutil.copy2(logo_src, store_output / logo_name)
+                        shutil.copyfile(logo_src, store_output / logo_name)
                         break
 
         return stores
@@ -329,7 +329,7 @@ class ExportDataScript(BaseScript):
                 for logo_name in ["logo.png", "logo.jpg", "logo.svg"]:
                     logo_src = brand_dir / logo_name
                     if logo_src.exists():
-                        shutil.copy2(logo_src, brand_output / logo_name)
+                        shutil.copyfile(logo_src, brand_output / logo_name)
                         break
 
             # Process materials
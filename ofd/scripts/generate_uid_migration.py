@@ -94,7 +94,9 @@ class GenerateUidMigrationScript(BaseScript):
 
         # Collected during the walk
         parse_errors: list[dict[str, str]] = []
-        old_filament_collisions: dict[str, list[str]] = {}
+        # old filament id -> (brand, material, filament) dir names; only the
+        # colliding ones are joined into paths for the report.
+        old_filament_collisions: dict[str, list[tuple[str, str, str]]] = {}
         # Candidates per old_id; multiple distinct new_ids means ambiguous.
         candidates: dict[str, set[str]] = {}
 
@@ -143,7 +145,7 @@ class GenerateUidMigrationScript(BaseScript):
                     new_fid = generate_filament_id(brand_id, material_id, filament_source_id)
 
                     old_filament_collisions.setdefault(old_fid, []).append(
-                        f"{brand_dir.name}/{material_dir.name}/{filament_dir.name}"
+                        (brand_dir.name, material_dir.name, filament_dir.name)
                     )
 
                     record(old_fid, new_fid)
@@ -207,7 +209,7 @@ class GenerateUidMigrationScript(BaseScript):
                 ambiguous[old_id] = sorted(new_ids)
 
         collisions = [
-            {"old_id": old_fid, "locations": sorted(locs)}
+            {"old_id": old_fid, "locations": sorted("/".join(loc) for loc in locs)}
             for old_fid, locs in sorted(old_filament_collisions.items())
             if len(locs) > 1
         ]
@@ -225,9 +227,9 @@ class GenerateUidMigrationScript(BaseScript):
         if parse_errors:
             payload["parse_errors"] = parse_errors
 
-        output_path.write_text(
-            json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
-        )
+        with output_path.open("w", encoding="utf-8") as fh:
+            json.dump(payload, fh, indent=2, ensure_ascii=False)
+            fh.write("\n")
 
         csv_path: Path | None = None
         if args.csv:
@@ -12,7 +12,6 @@ import os
 import re
 import subprocess
 import urllib.parse
-from collections import Counter
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -21,6 +20,11 @@ from typing import Any
 import requests
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from ofd.base import BaseScript, ScriptResult, register_script
 from ofd.merge import merge_dicts, merge_sizes
 from ofd.scripts.opt_naming_rules import (
@@ -74,6 +78,18 @@ DENSITY_DEFAULTS: dict[str, float] = {
     "PET": 1.38,
 }
 
+# Temperature fields copied from OPT material properties, in output order
+TEMPERATURE_FIELDS = (
+    "min_print_temperature",
+    "max_print_temperature",
+    "min_bed_temperature",
+    "max_bed_temperature",
+    "preheat_temperature",
+    "chamber_temperature",
+    "min_chamber_temperature",
+    "max_chamber_temperature",
+)
+
 # Default temperatures by material type (°C)
 TEMPERATURE_DEFAULTS: dict[str, dict[str, int]] = {
     "PLA": {
@@ -554,21 +570,24 @@ class ImportOpenPrintTagScript(BaseScript):
         self.emit_progress("processing", 0, "Processing brands...")
         total_brands = len(brands)
 
-        for i, (brand_slug, brand_data) in enumerate(sorted(brands.items())):
-            if brand_filter and brand_slug != brand_filter:
-                continue
-
-            progress = int((i / max(total_brands, 1)) * 100)
-            self.emit_progress("processing", progress, f"Processing {brand_slug}...")
+        # One session for all Brandfetch calls so lookups reuse the TLS connection
+        with requests.Session() as session:
+            for i, (brand_slug, brand_data) in enumerate(sorted(brands.items())):
+                if brand_filter and brand_slug != brand_filter:
+                    continue
 
-            self._process_brand(
-                brand_slug,
-                brand_data,
-                materials_by_brand.get(brand_slug, []),
-                packages_by_material,
-                skip_brandfetch,
-                dry_run,
-            )
+                progress = int((i / max(total_brands, 1)) * 100)
+                self.emit_progress("processing", progress, f"Processing {brand_slug}...")
+
+                self._process_brand(
+                    brand_slug,
+                    brand_data,
+                    materials_by_brand.get(brand_slug, []),
+                    packages_by_material,
+                    skip_brandfetch,
+                    dry_run,
+                    session,
+                )
 
         self.emit_progress("processing", 100, "Processing complete")
 
@@ -598,7 +617,7 @@ class ImportOpenPrintTagScript(BaseScript):
             if not skip_update:
                 self.log("Updating OpenPrintTag repository...")
                 result = subprocess.run(
-                    ["git", "-C", str(cache_path), "pull", "--ff-only"],
+                    ["git", "-C", cache_path, "pull", "--ff-only"],
                     capture_output=True,
                     text=True,
                 )
@@ -608,7 +627,7 @@ class ImportOpenPrintTagScript(BaseScript):
             self.log("Cloning OpenPrintTag repository...")
             cache_path.parent.mkdir(parents=True, exist_ok=True)
             result = subprocess.run(
-                ["git", "clone", "--depth=1", OPENPRINTTAG_REPO, str(cache_path)],
+                ["git", "clone", "--depth=1", OPENPRINTTAG_REPO, cache_path],
                 capture_output=True,
                 text=True,
             )
@@ -619,7 +638,8 @@ class ImportOpenPrintTagScript(BaseScript):
         """Load a YAML file."""
         try:
             with open(path, encoding="utf-8") as f:
-                return yaml.safe_load(f)
+                # Same safe tag set as yaml.safe_load, parsed by libyaml when available
+                return yaml.load(f, Loader=_YamlLoader)
         except Exception as e:
             self.report.errors.append(f"Failed to load {path.name}: {e}")
             return None
@@ -705,6 +725,7 @@ class ImportOpenPrintTagScript(BaseScript):
         packages_by_material: dict[str, list[dict]],
         skip_brandfetch: bool,
         dry_run: bool,
+        session: requests.Session,
     ) -> None:
         """Process a single brand and its materials."""
         brand_id = slugify(brand_slug)
@@ -775,12 +796,12 @@ class ImportOpenPrintTagScript(BaseScript):
 
         # Try Brandfetch if needed
         if not skip_brandfetch and (need_website or need_logo):
-            domain = self._discover_domain(merged_brand["name"])
+            domain = self._discover_domain(merged_brand["name"], session)
             if domain:
                 if need_website:
                     merged_brand["website"] = domain
                 if need_logo and not dry_run:
-                    logo_ext = self._download_logo(domain, brand_dir)
+                    logo_ext = self._download_logo(domain, brand_dir, session)
                     if logo_ext:
                         merged_brand["logo"] = f"logo.{logo_ext}"
                         need_logo = False
@@ -894,7 +915,7 @@ class ImportOpenPrintTagScript(BaseScript):
         """Merge new data into existing, only filling gaps."""
         return merge_dicts(existing, new)
 
-    def _discover_domain(self, brand_name: str) -> str | None:
+    def _discover_domain(self, brand_name: str, session: requests.Session) -> str | None:
         """Try to find brand domain using Brandfetch CDN, then search API."""
         if not self.brandfetch_client_id:
             return None
@@ -915,16 +936,16 @@ class ImportOpenPrintTagScript(BaseScript):
         for domain in patterns:
             url = f"https://cdn.brandfetch.io/{domain}?c={self.brandfetch_client_id}"
             try:
-                response = requests.head(url, timeout=5)
+                response = session.head(url, timeout=5)
                 if response.ok:
                     return f"https://{domain}"
             except Exception:
                 continue
 
         # Fallback: try Brandfetch Search API
-        return self._search_brandfetch(brand_name)
+        return self._search_brandfetch(brand_name, session)
 
-    def _search_brandfetch(self, brand_name: str) -> str | None:
+    def _search_brandfetch(self, brand_name: str, session: requests.Session) -> str | None:
         """
         Search Brandfetch API for brand domain as fallback.
 
@@ -940,7 +961,7 @@ class ImportOpenPrintTagScript(BaseScript):
         headers = {"Authorization": f"Bearer {self.brandfetch_client_id}"}
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = session.get(url, headers=headers, timeout=10)
             if response.ok:
                 results = response.json()
                 # Take the first/best match if available
@@ -954,7 +975,7 @@ class ImportOpenPrintTagScript(BaseScript):
 
         return None
 
-    def _download_logo(self, domain: str, brand_dir: Path) -> str | None:
+    def _download_logo(self, domain: str, brand_dir: Path, session: requests.Session) -> str | None:
         """Download logo from Brandfetch CDN."""
         if not self.brandfetch_client_id:
             return None
@@ -964,7 +985,7 @@ class ImportOpenPrintTagScript(BaseScript):
 
         url = f"https://cdn.brandfetch.io/{domain_only}?c={self.brandfetch_client_id}"
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             if response.ok:
                 content_type = response.headers.get("content-type", "").lower()
 
@@ -1077,28 +1098,16 @@ class ImportOpenPrintTagScript(BaseScript):
                 }
 
                 # Add temperature data: from OPT if available, otherwise from defaults
-                temp_fields = [
-                    "min_print_temperature",
-                    "max_print_temperature",
-                    "min_bed_temperature",
-                    "max_bed_temperature",
-                    "preheat_temperature",
-                    "chamber_temperature",
-                    "min_chamber_temperature",
-                    "max_chamber_temperature",
-                ]
-
                 if "min_print_temperature" in properties:
                     # Use OPT temperatures
-                    for field in temp_fields:
+                    for field in TEMPERATURE_FIELDS:
                         if field in properties:
                             filament_data[field] = properties[field]
                 else:
                     # Apply defaults based on material type
                     temp_defaults = TEMPERATURE_DEFAULTS.get(material_type, {})
                     if temp_defaults:
-                        for field, value in temp_defaults.items():
-                            filament_data[field] = value
+                        filament_data.update(temp_defaults)
                     else:
                         # No defaults available - track as missing
                         self.report.missing_temperatures.append(
@@ -1265,11 +1274,7 @@ class ImportOpenPrintTagScript(BaseScript):
 
     def _map_tags_to_traits(self, tags: list[str]) -> dict[str, bool]:
         """Convert OPT tags to internal traits dict."""
-        traits: dict[str, bool] = {}
-        for tag in tags:
-            if tag in TAG_TO_TRAIT_MAP:
-                traits[TAG_TO_TRAIT_MAP[tag]] = True
-        return traits
+        return {TAG_TO_TRAIT_MAP[tag]: True for tag in tags if tag in TAG_TO_TRAIT_MAP}
 
     # ------------------------------------------------------------------
     # Naming cleanup pipeline
@@ -1525,6 +1530,12 @@ class ImportOpenPrintTagScript(BaseScript):
             return hierarchy
 
         prefixes = PRODUCT_LINE_PREFIXES[brand_id]
+        # Alternation is tried left to right, so the match is the first prefix
+        # in list order, the same one a startswith() loop would stop at.
+        prefix_re = re.compile("|".join(map(re.escape, prefixes)))
+        # Product-line IDs and display names, derived once per brand
+        product_lines = {prefix: prefix.rstrip("_") or prefix for prefix in prefixes}
+        line_names = {line: clean_display_name(line) for line in product_lines.values()}
         sku_pattern = PRODUCT_LINE_SKU_PATTERNS.get(brand_id)
         sku_re = re.compile(sku_pattern) if sku_pattern else None
 
@@ -1534,36 +1545,39 @@ class ImportOpenPrintTagScript(BaseScript):
                 to_move: list[tuple[str, str, str, str]] = []
 
                 for color_id in sorted(colors.keys()):
-                    for prefix in prefixes:
-                        if not color_id.startswith(prefix):
-                            continue
-                        remainder = color_id[len(prefix) :]
-                        if sku_re:
-                            m = sku_re.match(remainder)
-                            if m:
-                                remainder = remainder[m.end() :]
-                        if not remainder:
-                            break
-                        product_line = prefix.rstrip("_") or prefix
-                        new_filament_id = f"{product_line}_{filament_id}"
-                        to_move.append(
-                            (
-                                color_id,
-                                remainder,
-                                new_filament_id,
-                                product_line,
-                            )
+                    prefix_match = prefix_re.match(color_id)
+                    if not prefix_match:
+                        continue
+                    product_line = product_lines[prefix_match.group()]
+                    remainder = color_id[prefix_match.end() :]
+                    if sku_re:
+                        m = sku_re.match(remainder)
+                        if m:
+                            remainder = remainder[m.end() :]
+                    if not remainder:
+                        continue
+                    new_filament_id = f"{product_line}_{filament_id}"
+                    to_move.append(
+                        (
+                            color_id,
+                            remainder,
+                            new_filament_id,
+                            product_line,
                         )
-                        break
+                    )
 
                 for old_id, new_id, new_filament_id, product_line in to_move:
                     entry = colors.pop(old_id)
 
                     # Update filament data
                     new_filament_data = entry["filament"].copy()
-                    source_name = new_filament_data.get("name", clean_display_name(filament_id))
+                    # Only derive a name from the id when the source has none
+                    if "name" in new_filament_data:
+                        source_name = new_filament_data["name"]
+                    else:
+                        source_name = clean_display_name(filament_id)
                     new_filament_data["id"] = new_filament_id
-                    new_filament_data["name"] = f"{clean_display_name(product_line)} {source_name}"
+                    new_filament_data["name"] = f"{line_names[product_line]} {source_name}"
                     entry["filament"] = new_filament_data
                     entry["variant"]["id"] = new_id
                     entry["variant"]["name"] = clean_display_name(new_id)
@@ -1588,6 +1602,9 @@ class ImportOpenPrintTagScript(BaseScript):
             return hierarchy
 
         suffixes = PRODUCT_LINE_SUFFIXES[brand_id]
+        # Product-line IDs and display names, derived once per brand
+        product_lines = {suffix: suffix.lstrip("_") or suffix for suffix in suffixes}
+        line_names = {line: clean_display_name(line) for line in product_lines.values()}
 
         for _material_type, filaments in hierarchy.items():
             for filament_id in list(filaments.keys()):
@@ -1601,7 +1618,7 @@ class ImportOpenPrintTagScript(BaseScript):
                         remainder = color_id[: -len(suffix)]
                         if not remainder:
                             break
-                        product_line = suffix.lstrip("_") or suffix
+                        product_line = product_lines[suffix]
                         new_filament_id = f"{product_line}_{filament_id}"
                         to_move.append(
                             (
@@ -1617,9 +1634,13 @@ class ImportOpenPrintTagScript(BaseScript):
                     entry = colors.pop(old_id)
 
                     new_filament_data = entry["filament"].copy()
-                    source_name = new_filament_data.get("name", clean_display_name(filament_id))
+                    # Only derive a name from the id when the source has none
+                    if "name" in new_filament_data:
+                        source_name = new_filament_data["name"]
+                    else:
+                        source_name = clean_display_name(filament_id)
                     new_filament_data["id"] = new_filament_id
-                    new_filament_data["name"] = f"{clean_display_name(product_line)} {source_name}"
+                    new_filament_data["name"] = f"{line_names[product_line]} {source_name}"
                     entry["filament"] = new_filament_data
                     entry["variant"]["id"] = new_id
                     entry["variant"]["name"] = clean_display_name(new_id)
@@ -1934,9 +1955,9 @@ class ImportOpenPrintTagScript(BaseScript):
         new colours are imported into the correct directory instead of
         being silently dropped.
 
-        Uses ``collections.Counter`` for the comparison so that IDs with
-        repeated words (e.g. ``pla_cf_cf``) are not falsely treated as
-        matching ``pla_cf``.
+        On-disk names are indexed by their sorted word tuple (a multiset,
+        not a set) so that IDs with repeated words (e.g. ``pla_cf_cf``) are
+        not falsely treated as matching ``pla_cf``.
 
         Mutates *hierarchy* in place and returns a list of log messages.
         """
@@ -1944,16 +1965,19 @@ class ImportOpenPrintTagScript(BaseScript):
         for material_type, filaments in hierarchy.items():
             if material_type not in existing_index:
                 continue
+            # Sorted words -> first on-disk filament with those words
+            by_words: dict[tuple[str, ...], str] = {}
+            for existing_fil in existing_index[material_type]:
+                by_words.setdefault(tuple(sorted(existing_fil.split("_"))), existing_fil)
+
             to_rename: list[tuple[str, str]] = []
             for filament_id in filaments:
                 if filament_id in existing_index[material_type]:
                     # Exact match on disk — no rename needed.
                     continue
-                fil_counter = Counter(filament_id.split("_"))
-                for existing_fil in existing_index[material_type]:
-                    if Counter(existing_fil.split("_")) == fil_counter:
-                        to_rename.append((filament_id, existing_fil))
-                        break
+                swapped = by_words.get(tuple(sorted(filament_id.split("_"))))
+                if swapped is not None:
+                    to_rename.append((filament_id, swapped))
             for old_id, new_id in to_rename:
                 colors = filaments.pop(old_id)
                 if new_id not in filaments:
@@ -91,8 +91,7 @@ class MergeDataScript(BaseScript):
         # Perform merge
         actions = merge_trees(target, source, dry_run=dry_run)
 
-        for action in actions:
-            self.log(f"  {action}")
+        self.log_lines(f"  {action}" for action in actions)
 
         if not actions:
             self.log("  No changes needed (target already has all data)")
@@ -114,8 +113,7 @@ class MergeDataScript(BaseScript):
                 self.log("Validation passed!")
             else:
                 self.log(f"Validation failed: {validation_result.error_count} error(s)")
-                for error in validation_result.errors:
-                    self.log(f"  {error}")
+                self.log_lines(f"  {error}" for error in validation_result.errors)
 
                 if delete_source:
                     self.log("\nSource NOT deleted (validation failed)")
@@ -4,6 +4,7 @@ Single source of truth for brand-specific rules, material keywords, color
 sets, and common utilities used by the import script.
 """
 
+import functools
 import re
 
 # ---------------------------------------------------------------------------
@@ -1570,23 +1571,34 @@ GENERIC_RENAME_RULES = [
 # ---------------------------------------------------------------------------
 
 
+# Compiled once: slugify runs for every imported brand, material and colour
+_SLUG_SEPARATORS = re.compile(r"[-\s]+")
+_SLUG_INVALID_CHARS = re.compile(r"[^a-z0-9_]")
+_SLUG_REPEATED_UNDERSCORES = re.compile(r"_+")
+
+
 def slugify(text: str) -> str:
     """Convert text to a valid ID (lowercase, underscores)."""
     text = text.lower()
-    text = re.sub(r"[-\s]+", "_", text)
-    text = re.sub(r"[^a-z0-9_]", "", text)
+    text = _SLUG_SEPARATORS.sub("_", text)
+    text = _SLUG_INVALID_CHARS.sub("", text)
     text = text.strip("_")
-    text = re.sub(r"_+", "_", text)
+    text = _SLUG_REPEATED_UNDERSCORES.sub("_", text)
     return text or "default"
 
 
+@functools.lru_cache(maxsize=4096)
 def clean_display_name(slug: str) -> str:
     """Convert a slug to a display name. E.g. 'dark_blue' -> 'Dark Blue'."""
     return slug.replace("_", " ").title()
 
 
+@functools.lru_cache(maxsize=4096)
 def is_color_like(name: str) -> bool:
-    """Check if a directory name looks like a color."""
+    """Check if a directory name looks like a color.
+
+    Cached because colour-splitting loops re-test the same suffixes for every variant.
+    """
     parts = name.split("_")
     # Simple color: "blue", "red"
     if name in KNOWN_COLORS:
@@ -1610,20 +1622,17 @@ def has_material_keyword(name: str) -> bool:
     return bool(parts & MATERIAL_KEYWORDS)
 
 
+@functools.lru_cache(maxsize=512)
 def id_to_display_name(slug: str) -> str:
     """Convert a filament/variant slug to a proper display name.
 
     Material keywords are uppercased; everything else is title-cased.
     E.g. ``95a_tpu`` -> ``95A TPU``, ``high_speed_pla`` -> ``High Speed PLA``.
+    Cached because the importer asks for the same filament slug once per variant.
     """
-    parts = slug.split("_")
-    result = []
-    for p in parts:
-        if p.lower() in _MATERIAL_UPPER:
-            result.append(p.upper())
-        else:
-            result.append(p.title())
-    return " ".join(result)
+    return " ".join(
+        p.upper() if p.lower() in _MATERIAL_UPPER else p.title() for p in slug.split("_")
+    )
 
 
 def compute_common_prefix(names: list[str]) -> str:
@@ -1681,17 +1690,25 @@ def prefix_implied_by_filament(prefix: str, filament_id: str, brand: str) -> boo
     return False
 
 
+@functools.cache
+def _longest_first(name_prefixes: tuple[str, ...]) -> tuple[str, ...]:
+    """Order prefixes longest first (stable, so ties keep their written order)."""
+    return tuple(sorted(name_prefixes, key=len, reverse=True))
+
+
 def strip_name_prefix(name: str, name_prefixes: list[str]) -> str:
     """Strip the product-line prefix from a display name, trying longest first."""
-    for prefix in sorted(name_prefixes, key=len, reverse=True):
+    ordered = _longest_first(tuple(name_prefixes))
+    for prefix in ordered:
         if name.startswith(prefix):
             result = name[len(prefix) :].strip().lstrip("-").strip()
             if result:
                 return result[0].upper() + result[1:] if result else name
             return name
     # Case-insensitive fallback
-    for prefix in sorted(name_prefixes, key=len, reverse=True):
-        if name.lower().startswith(prefix.lower()):
+    lowered = name.lower()
+    for prefix in ordered:
+        if lowered.startswith(prefix.lower()):
             result = name[len(prefix) :].strip().lstrip("-").strip()
             if result:
                 return result[0].upper() + result[1:] if result else name
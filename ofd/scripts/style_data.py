@@ -22,13 +22,16 @@ Pipeline (runs in order):
 
 import argparse
 import json
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from ofd.base import BaseScript, ScriptResult, register_script
+from ofd.builder.utils import load_json_bytes, subdirs
 from ofd.merge import merge_has_errors, merge_trees
+from ofd.merge import save_json as atomic_save_json
 from ofd.validation import ValidationOrchestrator
 
 # The canonical ID pattern from the schemas
@@ -49,6 +52,11 @@ OPTIONAL_STRING_FIELDS = {
     "ean",
 }
 
+# Shared encoders: json.dumps builds a fresh JSONEncoder on every call once
+# any keyword argument is passed, and these run for every file.
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
 
 @dataclass
 class SchemaInfo:
@@ -78,22 +86,20 @@ class ProcessingStats:
 
 
 def load_json(path: Path) -> dict[str, Any] | None:
-    """Load JSON from file with error handling."""
+    """Load JSON from file with error handling (see load_json_bytes)."""
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return load_json_bytes(f.read())
     except (json.JSONDecodeError, OSError) as e:
         print(f"Error loading {path}: {e}")
         return None
 
 
 def save_json(path: Path, data: Any, dry_run: bool) -> None:
-    """Save JSON to file with consistent formatting."""
+    """Save JSON to file with consistent formatting (see ofd.merge.save_json)."""
     if dry_run:
         return
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    atomic_save_json(path, data)
 
 
 def fix_slug(name: str) -> str:
@@ -185,11 +191,12 @@ def fix_folder_names(root_dir: Path, dry_run: bool) -> list[str]:
     if not root_dir.exists():
         return actions
 
-    # Collect all dirs with hyphens, deepest first
+    # Collect all dirs with hyphens, deepest first. os.walk hands back
+    # directory names straight from scandir, so files are never stat'ed.
     hyphenated: list[Path] = []
-    for dirpath in sorted(root_dir.rglob("*"), reverse=True):
-        if dirpath.is_dir() and "-" in dirpath.name:
-            hyphenated.append(dirpath)
+    for dirpath, dirnames, _filenames in os.walk(root_dir):
+        hyphenated.extend(Path(dirpath, name) for name in dirnames if "-" in name)
+    hyphenated.sort(reverse=True)
 
     for folder in hyphenated:
         fixed_name = fix_slug(folder.name)
@@ -394,20 +401,16 @@ class StyleDataScript(BaseScript):
 
     def _fix_json_indentation(self, file_path: Path, dry_run: bool, stats: ProcessingStats) -> bool:
         """Fix indentation of a JSON file to use 2 spaces."""
-        data = load_json(file_path)
-        if data is None:
-            stats.files_skipped += 1
-            return False
-
         try:
             with open(file_path, encoding="utf-8") as f:
                 original_content = f.read()
-        except OSError as e:
-            self.log(f"Error reading {file_path}: {e}")
+            data = load_json_bytes(original_content)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+            self.log(f"Error loading {file_path}: {e}")
             stats.files_skipped += 1
             return False
 
-        new_content = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+        new_content = _PRETTY_ENCODER.encode(data) + "\n"
 
         stats.files_processed += 1
 
@@ -441,10 +444,13 @@ class StyleDataScript(BaseScript):
 
         self.log("Fixing indentation for all JSON files...")
 
-        json_files = list(self.project_root.rglob("*.json"))
-
+        # Prune excluded directories during the walk instead of descending into
+        # them and filtering every collected path by its parts afterwards.
         excluded_dirs = {"node_modules", ".git", "dist", "build", ".venv", "venv"}
-        json_files = [f for f in json_files if not any(part in excluded_dirs for part in f.parts)]
+        json_files: list[Path] = []
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            dirnames[:] = [name for name in dirnames if name not in excluded_dirs]
+            json_files.extend(Path(dirpath, name) for name in filenames if name.endswith(".json"))
 
         for json_file in sorted(json_files):
             self._fix_json_indentation(json_file, dry_run, stats)
@@ -523,8 +529,7 @@ class StyleDataScript(BaseScript):
         folder_renames: list[str] = []
         for directory in [self.data_dir, self.stores_dir]:
             folder_renames.extend(fix_folder_names(directory, dry_run))
-        for rename in folder_renames:
-            self.log(f"  {rename}")
+        self.log_lines(f"  {rename}" for rename in folder_renames)
         if not folder_renames:
             self.log("  No folder renames needed")
         self.emit_progress("fixing_folders", 100, "Folder names fixed")
@@ -579,8 +584,7 @@ class StyleDataScript(BaseScript):
 
             if not validation_result.is_valid:
                 self.log(f"\nValidation failed: {validation_result.error_count} error(s)")
-                for error in validation_result.errors:
-                    self.log(f"  {error}")
+                self.log_lines(f"  {error}" for error in validation_result.errors)
 
                 return ScriptResult(
                     success=False,
@@ -659,8 +663,8 @@ class StyleDataScript(BaseScript):
             self.log(f"  Warning: Extra keys in {file_path.name}: {sorted(extra_keys)}")
             stats.extra_keys_found += len(extra_keys)
 
-        original_json = json.dumps(data, ensure_ascii=False, sort_keys=False)
-        sorted_json = json.dumps(sorted_data, ensure_ascii=False, sort_keys=False)
+        original_json = _COMPACT_ENCODER.encode(data)
+        sorted_json = _COMPACT_ENCODER.encode(sorted_data)
 
         stats.files_processed += 1
 
@@ -683,40 +687,28 @@ class StyleDataScript(BaseScript):
         stats = ProcessingStats()
         self.log("Processing data directory...")
 
-        for brand_dir in sorted(self.data_dir.iterdir()):
-            if not brand_dir.is_dir():
-                continue
-
+        for brand_dir in subdirs(self.data_dir):
             self.log(f"  Brand: {brand_dir.name}")
 
             brand_file = brand_dir / "brand.json"
             if brand_file.exists():
                 self._process_json_file(brand_file, "brand", key_order_map, dry_run, stats)
 
-            for material_dir in sorted(brand_dir.iterdir()):
-                if not material_dir.is_dir():
-                    continue
-
+            for material_dir in subdirs(brand_dir):
                 material_file = material_dir / "material.json"
                 if material_file.exists():
                     self._process_json_file(
                         material_file, "material", key_order_map, dry_run, stats
                     )
 
-                for filament_dir in sorted(material_dir.iterdir()):
-                    if not filament_dir.is_dir():
-                        continue
-
+                for filament_dir in subdirs(material_dir):
                     filament_file = filament_dir / "filament.json"
                     if filament_file.exists():
                         self._process_json_file(
                             filament_file, "filament", key_order_map, dry_run, stats
                         )
 
-                    for variant_dir in sorted(filament_dir.iterdir()):
-                        if not variant_dir.is_dir():
-                            continue
-
+                    for variant_dir in subdirs(filament_dir):
                         variant_file = variant_dir / "variant.json"
                         if variant_file.exists():
                             self._process_json_file(
@@ -738,10 +730,7 @@ class StyleDataScript(BaseScript):
         stats = ProcessingStats()
         self.log("\nProcessing stores directory...")
 
-        for store_dir in sorted(self.stores_dir.iterdir()):
-            if not store_dir.is_dir():
-                continue
-
+        for store_dir in subdirs(self.stores_dir):
             self.log(f"  Store: {store_dir.name}")
 
             store_file = store_dir / "store.json"
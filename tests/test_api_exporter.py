@@ -0,0 +1,171 @@
+"""Tests for the static API exporter."""
+
+import json
+import tarfile
+
+import pytest
+
+from ofd.builder.exporters.api_exporter import export_api
+from ofd.builder.models import Database
+
+
+def make_db() -> Database:
+    db = Database()
+    db.brands = [
+        {
+            "id": "b1",
+            "name": "Bambu Lab",
+            "slug": "bambu_lab",
+            "origin": "CN",
+            "website": "https://bambulab.com",
+            "logo": "logo.png",
+            "directory_name": "bambu_lab",
+        },
+    ]
+    db.materials = [
+        {"id": "m1", "brand_id": "b1", "material": "PLA", "slug": "pla"},
+    ]
+    db.filaments = [
+        {
+            "id": "f1",
+            "brand_id": "b1",
+            "material_id": "m1",
+            "name": "PLA Basic",
+            "slug": "pla_basic",
+            "discontinued": False,
+        },
+        {"id": "f2", "brand_id": "b1", "material_id": "m1", "name": "PLA Empty", "slug": "empty"},
+    ]
+    db.variants = [
+        {"id": "v1", "filament_id": "f1", "name": "Black", "slug": "black", "color_hex": "#000000"},
+    ]
+    db.sizes = [
+        {"id": "sz1", "variant_id": "v1", "filament_weight": 1000, "diameter": 1.75},
+        {"id": "sz2", "variant_id": "v1", "filament_weight": 250, "diameter": 1.75},
+    ]
+    db.stores = [
+        {
+            "id": "s1",
+            "name": "Bambu Store",
+            "slug": "bblstore",
+            "storefront_url": "https://store.bambulab.com",
+            "logo": "logo.png",
+            "directory_name": "bblstore",
+            "ships_from": ["CN"],
+            "ships_to": [],
+        },
+    ]
+    db.purchase_links = [
+        {"id": "pl1", "size_id": "sz1", "store_id": "s1", "url": "https://example.com/pla"},
+    ]
+    return db
+
+
+def read_json(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def export(tmp_path, db=None, **kwargs):
+    export_api(
+        db or make_db(),
+        str(tmp_path),
+        "2026.06.01",
+        "2026-06-01T00:00:00Z",
+        include_logos=False,
+        **kwargs,
+    )
+    return tmp_path / "api" / "v1"
+
+
+def test_exports_hierarchy_without_logos(tmp_path):
+    api = export(tmp_path)
+
+    brand = read_json(api / "brands" / "bambu_lab" / "index.json")
+    assert brand["logo_name"] == "logo.png"
+    assert "directory_name" not in brand
+    assert "logo_slug" not in brand
+    assert brand["materials"][0]["path"] == "materials/pla/index.json"
+
+    fil_path = api / "brands" / "bambu_lab" / "materials" / "pla" / "filaments" / "pla_basic"
+    filament = read_json(fil_path / "index.json")
+    assert filament["variants"] == [
+        {
+            "id": "v1",
+            "name": "Black",
+            "color_hex": "#000000",
+            "slug": "black",
+            "size_count": 2,
+            "path": "variants/black.json",
+        }
+    ]
+
+
+def test_variant_leaf_embeds_sizes_and_purchase_links(tmp_path):
+    db = make_db()
+    api = export(tmp_path, db)
+
+    fil_path = api / "brands" / "bambu_lab" / "materials" / "pla" / "filaments" / "pla_basic"
+    variant = read_json(fil_path / "variants" / "black.json")
+    assert [s["id"] for s in variant["sizes"]] == ["sz1", "sz2"]
+    assert variant["sizes"][0]["purchase_links"][0]["url"] == "https://example.com/pla"
+    assert "purchase_links" not in variant["sizes"][1]
+
+    # Exporting must not leak computed keys back into the crawled entities.
+    assert "purchase_links" not in db.sizes[0]
+    assert "sizes" not in db.variants[0]
+
+
+def test_filament_without_variants_has_no_variants_dir(tmp_path):
+    api = export(tmp_path)
+
+    fil_path = api / "brands" / "bambu_lab" / "materials" / "pla" / "filaments" / "empty"
+    assert read_json(fil_path / "index.json")["variants"] == []
+    assert not (fil_path / "variants").exists()
+
+
+def test_bundle_is_opt_in(tmp_path):
+    api = export(tmp_path)
+
+    assert not (tmp_path / "api" / "v1.tar.gz").exists()
+    assert "bundle" not in read_json(api / "index.json")["endpoints"]
+
+
+def test_bundle_contains_every_api_file(tmp_path):
+    api = export(tmp_path, bundle=True)
+
+    with tarfile.open(tmp_path / "api" / "v1.tar.gz") as tar:
+        names = tar.getnames()
+        leaf = tar.extractfile(
+            "v1/brands/bambu_lab/materials/pla/filaments/pla_basic/variants/black.json"
+        ).read()
+
+    on_disk = sorted(str(p.relative_to(api.parent)) for p in api.rglob("*") if p.is_file())
+    assert sorted(names) == on_disk
+    assert json.loads(leaf)["id"] == "v1"
+    assert read_json(api / "index.json")["endpoints"]["bundle"] == "../v1.tar.gz"
+
+
+def test_missing_data_dir_fails_logo_export(tmp_path):
+    with pytest.raises(FileNotFoundError, match="brand 'Bambu Lab'"):
+        export_api(
+            make_db(),
+            str(tmp_path),
+            "2026.06.01",
+            "2026-06-01T00:00:00Z",
+            data_dir=str(tmp_path / "missing_data"),
+            stores_dir=str(tmp_path / "missing_stores"),
+        )
+
+
+def test_missing_logo_names_the_brand(tmp_path):
+    (tmp_path / "data" / "bambu_lab").mkdir(parents=True)
+
+    with pytest.raises(FileNotFoundError, match="brand 'Bambu Lab'"):
+        export_api(
+            make_db(),
+            str(tmp_path),
+            "2026.06.01",
+            "2026-06-01T00:00:00Z",
+            data_dir=str(tmp_path / "data"),
+            stores_dir=str(tmp_path / "missing_stores"),
+        )
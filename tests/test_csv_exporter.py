@@ -0,0 +1,58 @@
+"""Tests for the CSV exporter."""
+
+import csv
+
+from ofd.builder.exporters.csv_exporter import export_csv
+from ofd.builder.models import Database
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def test_repeated_json_cells_keep_value_types(tmp_path):
+    db = Database()
+    db.variants = [
+        {"id": "v1", "filament_id": "f1", "slug": "a", "traits": {"glow": True}},
+        {"id": "v2", "filament_id": "f1", "slug": "b", "traits": {"glow": 1}},
+        {"id": "v3", "filament_id": "f1", "slug": "c", "traits": {"glow": True}},
+        {"id": "v4", "filament_id": "f1", "slug": "d", "traits": {"glow": {"uv": True}}},
+    ]
+
+    export_csv(db, str(tmp_path), "2026.06.01", "2026-06-01T00:00:00Z")
+
+    rows = read_rows(tmp_path / "csv" / "variants.csv")
+    assert [r["traits"] for r in rows] == [
+        '{"glow": true}',
+        '{"glow": 1}',
+        '{"glow": true}',
+        '{"glow": {"uv": true}}',
+    ]
+
+
+def test_brand_logo_exported_as_logo_name(tmp_path):
+    db = Database()
+    db.brands = [
+        {"id": "b1", "name": "Acme", "slug": "acme", "logo": "logo.png", "directory_name": "acme"},
+        {"id": "b2", "name": "Bolt", "slug": "bolt", "logo": "logo.svg", "directory_name": "bolt"},
+    ]
+
+    export_csv(db, str(tmp_path), "2026.06.01", "2026-06-01T00:00:00Z")
+
+    rows = read_rows(tmp_path / "csv" / "brands.csv")
+    assert [r["logo_name"] for r in rows] == ["logo.png", "logo.svg"]
+    assert "logo" not in rows[0] and "directory_name" not in rows[0]
+
+
+def test_repeated_json_cells_keep_float_sign(tmp_path):
+    db = Database()
+    db.variants = [
+        {"id": "v1", "filament_id": "f1", "slug": "a", "traits": {"t": 0.0}},
+        {"id": "v2", "filament_id": "f1", "slug": "b", "traits": {"t": -0.0}},
+    ]
+
+    export_csv(db, str(tmp_path), "2026.06.01", "2026-06-01T00:00:00Z")
+
+    rows = read_rows(tmp_path / "csv" / "variants.csv")
+    assert [r["traits"] for r in rows] == ['{"t": 0.0}', '{"t": -0.0}']
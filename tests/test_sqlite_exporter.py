@@ -0,0 +1,117 @@
+"""Tests for the SQLite exporter."""
+
+import lzma
+import shutil
+import sqlite3
+
+import pytest
+
+from ofd.builder.exporters import sqlite_exporter
+from ofd.builder.exporters.sqlite_exporter import compress_xz, export_sqlite
+from ofd.builder.models import Database
+from ofd.builder.serialization import insert_entities
+
+
+def test_export_binds_bools_and_json(tmp_path):
+    db = Database()
+    db.brands = [
+        {
+            "id": "b1",
+            "name": "Acme",
+            "slug": "acme",
+            "website": "https://acme.example",
+            "logo": "logo.png",
+            "origin": "DE",
+            "directory_name": "acme",
+        }
+    ]
+    db.materials = [
+        {"id": "m1", "brand_id": "b1", "material": "PLA", "slug": "pla", "material_class": "FFF"}
+    ]
+    db.filaments = [
+        {
+            "id": "f1",
+            "brand_id": "b1",
+            "material_id": "m1",
+            "name": "PLA Basic",
+            "slug": "pla_basic",
+            "material": "PLA",
+            "density": 1.24,
+            "diameter_tolerance": 0.02,
+            "discontinued": False,
+        }
+    ]
+    db.variants = [
+        {
+            "id": "v1",
+            "filament_id": "f1",
+            "slug": "black",
+            "name": "Black",
+            "color_hex": "#000000",
+            "traits": {"glow": False},
+            "discontinued": True,
+        }
+    ]
+
+    export_sqlite(db, str(tmp_path), "2026.06.01", "2026-06-01T00:00:00Z")
+
+    conn = sqlite3.connect(tmp_path / "sqlite" / "filaments.db")
+    try:
+        assert conn.execute("SELECT logo_name FROM brand").fetchall() == [("logo.png",)]
+        assert conn.execute(
+            "SELECT traits, discontinued, typeof(discontinued) FROM variant"
+        ).fetchall() == [('{"glow": false}', 1, "integer")]
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("use_cli", [True, False])
+def test_compress_xz_keeps_original(tmp_path, monkeypatch, use_cli):
+    if use_cli and not shutil.which("xz"):
+        pytest.skip("xz CLI not installed")
+    if not use_cli:
+        monkeypatch.setattr(sqlite_exporter.shutil, "which", lambda name: None)
+
+    source = tmp_path / "filaments.db"
+    payload = b"SQLite format 3\x00" + bytes(range(256)) * 64
+    source.write_bytes(payload)
+
+    xz_path = compress_xz(source)
+
+    assert xz_path == tmp_path / "filaments.db.xz"
+    assert source.read_bytes() == payload
+    assert lzma.decompress(xz_path.read_bytes()) == payload
+
+
+def test_insert_entities_spans_several_statements():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(sqlite_exporter.SCHEMA_DDL)
+    brands = [
+        {
+            "id": f"b{i}",
+            "name": f"Brand {i}",
+            "slug": f"brand_{i}",
+            "website": "https://example.com",
+            "logo": "logo.png",
+            "origin": "DE",
+            "directory_name": f"brand_{i}",
+        }
+        for i in range(1000)
+    ]
+
+    insert_entities(conn, brands, "brand")
+
+    rows = conn.execute("SELECT id, logo_name, source FROM brand ORDER BY rowid").fetchall()
+    assert rows == [(f"b{i}", "logo.png", None) for i in range(1000)]
+
+
+def test_export_rejects_dangling_references(tmp_path):
+    db = Database()
+    db.materials = [
+        {"id": "m1", "brand_id": "nope", "material": "PLA", "slug": "pla", "material_class": "FFF"}
+    ]
+
+    with pytest.raises(sqlite3.IntegrityError, match="material row 1 references a missing brand"):
+        export_sqlite(db, str(tmp_path), "2026.06.01", "2026-06-01T00:00:00Z")
+
+    assert not (tmp_path / "sqlite" / "filaments.db").exists()